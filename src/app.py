@@ -2,60 +2,58 @@
 
 Highlights
 - Server-side pagination (container start/size)
-- Lightweight per-page title filter
+- Server-side year and title filters
 - Selection persists with batch updates and rate limiting
 - URL query params for pager navigation
 """
 import datetime
+import functools
+import html
+import logging
+import os
+import threading
 import time
-from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
 
 import streamlit as st
 
+import numpy as np
+import pandas as pd
+
+from cli import RateGate
 from plex_api import PlexAPI
 from streamlit import components
 from string import Template
 
+_log = logging.getLogger(__name__)
 
 st.set_page_config(page_title="Plex Added Date Manager", layout="wide")
 
+# Selectbox order; also the set of values accepted from the URL/localStorage
+_DENSITIES = ("Comfortable", "Compact", "Ultra Compact", "Spacious")
+
 
 def _maybe_apply_density_from_query() -> None:
-    try:
-        qp = dict(st.query_params)
-    except Exception:
-        try:
-            qp = st.experimental_get_query_params()  # type: ignore[attr-defined]
-        except Exception:
-            qp = {}
-    if not qp:
+    if st.session_state.get("_qp_unchanged"):
+        return
+    qp = _qp_get()
+    if "ui_density" not in qp:
         return
-    raw = qp.get("ui_density")
-    valid = {"Ultra Compact", "Compact", "Comfortable", "Spacious"}
-    val = raw[0] if isinstance(raw, list) else raw
-    if val and val in valid:
+    val = _qp_first(qp, "ui_density")
+    if val in _DENSITIES:
         st.session_state["ui_density"] = val
-        try:
-            st.query_params.clear()
-            for k, v in qp.items():
-                if k == "ui_density":
-                    continue
-                st.query_params[k] = v
-        except Exception:
-            try:
-                qp2 = {
-                    k: (v[0] if isinstance(v, list) else v)
-                    for k, v in qp.items()
-                    if k != "ui_density"
-                }
-                st.experimental_set_query_params(**qp2)  # type: ignore[attr-defined]
-            except Exception:
-                pass
+        qp.pop("ui_density", None)
+        _qp_set({k: (v[0] if isinstance(v, list) else v) for k, v in qp.items()})
 
 
 def _inject_density_bootstrap() -> None:
+    # The script only matters on the first run of a session (it guards itself
+    # via sessionStorage), so skip the iframe mount on every later rerun.
+    if st.session_state.get("_density_bootstrapped"):
+        return
     cur = st.session_state.get("ui_density", "Comfortable")
-    html = f"""
+    script = f"""
     <script>
       (function(){{
         try {{
@@ -74,80 +72,141 @@ def _inject_density_bootstrap() -> None:
     </script>
     """
     try:
-        components.v1.html(html, height=0)  # type: ignore[attr-defined]
+        components.v1.html(script, height=0)  # type: ignore[attr-defined]
     except Exception:
-        pass
+        return
+    st.session_state["_density_bootstrapped"] = True
 
 
-# Lightweight styling
-st.markdown(
-    """
-    <style>
-    .meta { color:#6b7280; font-size:0.9rem; margin:4px 0 0; }
-    .title-row h3 { margin-bottom: 2px; }
-    .subtle { color:#6b7280; }
-    .chip { display:inline-block; background:#eef2ff; color:#3730a3; padding:2px 8px; border-radius:12px; font-size:0.75rem; margin-right:6px; }
-    /* Leave room for fixed mini-pager at top */
-    .block-container { padding-top: 3.0rem; }
-    </style>
-    """,
-    unsafe_allow_html=True,
+# Fragments scope reruns to one tab; older Streamlit builds fall back to
+# plain functions (full-script reruns, same behavior as before).
+_fragment = (
+    getattr(st, "fragment", None)
+    or getattr(st, "experimental_fragment", None)
+    or (lambda fn: fn)
 )
 
 
-def _safe_rerun() -> None:
-    try:
-        if hasattr(st, "rerun"):
-            st.rerun()
-            return
-        if hasattr(st, "experimental_rerun"):
-            st.experimental_rerun()
-            return
-    except Exception:
-        pass
+def _apply_filters(prefix: str) -> None:
+    """on_click for "Apply Filters": commit the title needle, back to page 1.
+
+    New filters usually change the result count, so the current page may no
+    longer exist.
+    """
+    raw = st.session_state.get(f"{prefix}_title_filter_raw", "")
+    needle = (raw or "").strip().lower()
+    title_key = f"{prefix}_title_filter"
+    if needle != st.session_state.get(title_key, ""):
+        st.session_state[title_key] = needle
+    st.session_state[f"{prefix}_page"] = 1
+
+
+def _reset_filters(prefix: str) -> None:
+    # Runs as an on_click callback, before the filter widgets are created
+    st.session_state[f"{prefix}_year_filter"] = ""
+    st.session_state[f"{prefix}_title_filter"] = ""
+    st.session_state[f"{prefix}_title_filter_raw"] = ""
+    st.session_state[f"{prefix}_sort"] = "addedAt:desc"
+    st.session_state[f"{prefix}_page"] = 1
+
+
+@functools.lru_cache(maxsize=1024)
+def _date_to_unix(d: datetime.date) -> int:
+    """Local midnight of ``d`` as a unix timestamp.
+
+    Only a handful of distinct dates come through per session, so the
+    timezone lookup behind .timestamp() runs once per date. DST stays
+    correct, unlike a fixed offset.
+    """
+    return int(datetime.datetime.combine(d, datetime.time.min).timestamp())
+
+
+@functools.lru_cache(maxsize=8192)
+def _unix_to_date(ts: int) -> datetime.date:
+    """Local calendar date of a unix timestamp (pages repeat across reruns)."""
+    return datetime.date.fromtimestamp(ts)
+
+
+def _reset_all() -> None:
+    # on_click: runs before any widget exists, so no extra rerun is needed
+    ss = st.session_state
+    for k in [k for k in ss if k.startswith(_TAB_PREFIXES)]:
+        del ss[k]
+    ss["ui_density"] = "Comfortable"
+    # Clear nav query params
+    _qp_set({})
+
+
+def _toggle_settings() -> None:
+    ss = st.session_state
+    ss["ui_show_settings"] = not ss.get("ui_show_settings", False)
+
+
+def _reset_density() -> None:
+    # on_click: the Density selectbox is created before this button, so the
+    # key can only be reset before the script runs
+    st.session_state["ui_density"] = "Comfortable"
+
+
+def _total_pages(total: int, page_size: int) -> int:
+    return max(1, -(-total // page_size))
+
+
+def _set_page(page_state_key: str, page: int) -> None:
+    # on_click: the click already reruns this tab's fragment, and the page is
+    # set before it renders, so no extra rerun is needed
+    st.session_state[page_state_key] = page
+
+
+def _goto_page(page_state_key: str, input_key: str) -> None:
+    st.session_state[page_state_key] = int(st.session_state[input_key])
 
 
 def _nav(
     prefix: str,
     position: str,
-    cfg: Dict,
+    page: int,
     total_pages: int,
     total: int,
     page_state_key: str,
 ) -> None:
     nav_l, nav_c, nav_r = st.columns([1, 2, 2])
     with nav_l:
-        if st.button(
-            "< Prev", key=f"{prefix}_{position}_prev", disabled=cfg["page"] <= 1
-        ):
-            st.session_state[page_state_key] = max(1, int(cfg["page"]) - 1)
-            _safe_rerun()
+        st.button(
+            "< Prev",
+            key=f"{prefix}_{position}_prev",
+            disabled=page <= 1,
+            on_click=_set_page,
+            args=(page_state_key, max(1, page - 1)),
+        )
     with nav_c:
-        st.write(f"Page {cfg['page']} of {total_pages} - Total {total}")
+        st.write(f"Page {page} of {total_pages} - Total {total}")
     with nav_r:
-        goto = st.number_input(
+        goto_key = f"{prefix}_{position}_goto"
+        st.number_input(
             "Go to page",
             min_value=1,
-            max_value=max(1, int(total_pages)),
-            value=int(min(max(1, int(cfg["page"])), max(1, int(total_pages)))),
+            max_value=total_pages,
+            value=min(max(1, page), total_pages),
             step=1,
-            key=f"{prefix}_{position}_goto",
+            key=goto_key,
         )
-        if st.button("Go", key=f"{prefix}_{position}_go"):
-            st.session_state[page_state_key] = int(goto)
-            _safe_rerun()
-        if st.button(
+        st.button(
+            "Go",
+            key=f"{prefix}_{position}_go",
+            on_click=_goto_page,
+            args=(page_state_key, goto_key),
+        )
+        st.button(
             "Next >",
             key=f"{prefix}_{position}_next",
-            disabled=int(cfg["page"]) >= int(total_pages),
-        ):
-            st.session_state[page_state_key] = min(
-                int(total_pages), int(cfg["page"]) + 1
-            )
-            _safe_rerun()
+            disabled=page >= total_pages,
+            on_click=_set_page,
+            args=(page_state_key, min(total_pages, page + 1)),
+        )
 
 
-def _qp_get() -> Dict[str, List[str]]:
+def _qp_read() -> Dict:
     try:
         return dict(st.query_params)
     except Exception:
@@ -157,11 +216,37 @@ def _qp_get() -> Dict[str, List[str]]:
             return {}
 
 
+def _qp_get() -> Dict:
+    """Return a copy of this run's query params, read from Streamlit once.
+
+    The snapshot is dropped at the top of main() and kept in sync by _qp_set,
+    so density hydration and every tab's nav share a single read.
+    """
+    snap = st.session_state.get("_qp_cache")
+    if snap is None:
+        snap = _qp_read()
+        st.session_state["_qp_cache"] = snap
+    return dict(snap)
+
+
+def _qp_signature(q: Dict) -> Tuple:
+    return tuple(sorted((k, _qp_first(q, k)) for k in q))
+
+
 def _qp_set(params: Dict[str, str]) -> None:
+    """Replace all query params with a single URL update (none if unchanged)."""
+    snap = _qp_get()
+    if {k: _qp_first(snap, k) for k in snap} == params:
+        return
+    st.session_state["_qp_cache"] = dict(params)
+    st.session_state["_qp_sig"] = _qp_signature(params)
     try:
-        st.query_params.clear()
-        for k, v in params.items():
-            st.query_params[k] = v
+        qp = st.query_params
+        if hasattr(qp, "from_dict"):
+            qp.from_dict(params)
+        else:
+            qp.clear()
+            qp.update(params)
     except Exception:
         try:
             st.experimental_set_query_params(**params)  # type: ignore[attr-defined]
@@ -169,131 +254,533 @@ def _qp_set(params: Dict[str, str]) -> None:
             pass
 
 
+def _qp_first(q: Dict, key: str) -> str:
+    # st.query_params yields str values; the experimental API yields lists
+    v = q.get(key)
+    if isinstance(v, list):
+        return v[0] if v else ""
+    return v or ""
+
+
 def _handle_query_nav(prefix: str, page_state_key: str, total_pages: int) -> None:
+    """Apply pager params from the URL (deep links / no-JS fallback).
+
+    Called before the tab reads its page, so the new page renders in the
+    same run. ``total_pages`` is the last known count; 0 means unknown.
+    """
+    if st.session_state.get("_qp_unchanged"):
+        return
     q = _qp_get()
     nav_key = f"{prefix}_nav"
     goto_key = f"{prefix}_goto"
-    changed = False
-    if nav_key in q:
-        val = (q.get(nav_key) or [""])[0]
-        page = int(st.session_state[page_state_key])
-        if val == "prev" and page > 1:
-            st.session_state[page_state_key] = page - 1
-            changed = True
-        elif val == "next" and page < int(total_pages):
-            st.session_state[page_state_key] = page + 1
-            changed = True
+    if nav_key not in q and goto_key not in q:
+        return
+    upper = total_pages or None
+    page = int(st.session_state[page_state_key])
+    val = _qp_first(q, nav_key)
+    if val == "prev" and page > 1:
+        page -= 1
+    elif val == "next" and (upper is None or page < upper):
+        page += 1
     if goto_key in q:
         try:
-            page = int((q.get(goto_key) or [""])[0])
-            page = max(1, min(int(total_pages), page))
-            st.session_state[page_state_key] = page
-            changed = True
-        except Exception:
+            page = max(1, int(_qp_first(q, goto_key)))
+        except ValueError:
             pass
-    if changed:
-        for k in [nav_key, goto_key]:
-            if k in q:
-                del q[k]
-        _qp_set({k: (v[0] if isinstance(v, list) else v) for k, v in q.items()})
-        _safe_rerun()
+        if upper is not None:
+            page = min(upper, page)
+    st.session_state[page_state_key] = page
+    for k in [nav_key, goto_key]:
+        q.pop(k, None)
+    _qp_set({k: (v[0] if isinstance(v, list) else v) for k, v in q.items()})
+
+
+_FIXED_PAGER_DIR = os.path.join(os.path.dirname(__file__), "components", "fixed_pager")
+try:
+    _fixed_pager = components.v1.declare_component(  # type: ignore[attr-defined]
+        "fixed_pager", path=_FIXED_PAGER_DIR
+    )
+except Exception:
+    _fixed_pager = None
+
+
+def _apply_pager_action(prefix: str) -> None:
+    """on_change handler: apply a Prev/Next/Go action sent by the pager."""
+    action = st.session_state.get(f"{prefix}_fixed_pager") or {}
+    page_key = f"{prefix}_page"
+    total_pages = st.session_state.get(f"{prefix}_total_pages") or 1
+    page = int(st.session_state.get(page_key, 1))
+    kind = action.get("action")
+    if kind == "prev":
+        page -= 1
+    elif kind == "next":
+        page += 1
+    elif kind == "goto":
+        try:
+            page = int(action.get("page") or page)
+        except (TypeError, ValueError):
+            pass
+    st.session_state[page_key] = max(1, min(total_pages, page))
+
+
+# Pager bar height per density; sizes live in CSS keyed by data-density, so
+# switching density is an attribute change rather than new CSS.
+_PAGER_NAV_H = {"Ultra Compact": 40, "Compact": 44, "Comfortable": 48, "Spacious": 56}
+# Sticky filter row offset below the header; other densities use 48px
+_STICKY_TOP = {"Compact": 44, "Spacious": 56}
+
+
+def _density_slug(density: str) -> str:
+    return density.lower().replace(" ", "-")
+
+
+def _minify(markup: str) -> str:
+    """Strip indentation, blank lines and whole-line ``//`` comments.
+
+    Line breaks are kept so JavaScript's semicolon insertion is unaffected.
+    """
+    lines = (line.strip() for line in markup.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+# Fallback pager templates, minified once at import. The style/script shell
+# only depends on the tab, so it is substituted once and cached; per rerun we
+# only format the small body with the page numbers and density attribute.
+_PAGER_STYLE_TPL = Template(
+    _minify(
+        """
+<style>
+  #fixed-pager-$prefix {
+    --nav-h: 48px; --pad-v: 6px; --font: 13px; --muted: 12px;
+    position: fixed; top: 0; left: 0; right: 0; height: var(--nav-h);
+    background: rgba(255,255,255,0.9); backdrop-filter: blur(4px);
+    border-bottom: 1px solid #e5e7eb; z-index: 1000;
+    display: flex; align-items: center; gap: 8px; padding: var(--pad-v) 12px; font-family: ui-sans-serif, system-ui; font-size: var(--font);
+  }
+  #fixed-pager-$prefix[data-density="ultra-compact"] { --nav-h: 40px; --pad-v: 4px; --font: 12px; --muted: 11px; }
+  #fixed-pager-$prefix[data-density="compact"] { --nav-h: 44px; --pad-v: 6px; --font: 12px; --muted: 11px; }
+  #fixed-pager-$prefix[data-density="spacious"] { --nav-h: 56px; --pad-v: 8px; --font: 14px; --muted: 13px; }
+  #fixed-pager-$prefix input { width: 70px; }
+  #fixed-pager-$prefix .spacer { flex: 1; }
+  #fixed-pager-$prefix .muted { color:#6b7280; font-size: var(--muted); }
+  @media (max-width: 640px) { #fixed-pager-$prefix { font-size: var(--muted); } }
+</style>
+"""
+    )
+)
+_PAGER_SCRIPT_TPL = Template(
+    _minify(
+        """
+<script>
+  (function(){
+    const tabLabel = "$tab";
+    const prefix = "$prefix";
+    const root = document.getElementById('fixed-pager-'+prefix);
+    const gotoEl = root.querySelector('.goto');
+    // textContent avoids the forced layout that innerText triggers
+    function activeTab(){
+      const t = parent.document.querySelector('button[role="tab"][aria-selected="true"]');
+      return t ? t.textContent.trim() : '';
+    }
+    let isActive = false;
+    let pending = false;
+    function showIfActive(){
+      // Read once, then write in the next frame (no read/write interleave)
+      isActive = activeTab()===tabLabel;
+      if (pending) return;
+      pending = true;
+      requestAnimationFrame(()=>{
+        pending = false;
+        const desired = isActive ? 'flex' : 'none';
+        if (root.style.display !== desired) root.style.display = desired;
+      });
+    }
+    function setParam(k,v){
+      try {
+        const url = new URL(parent.location);
+        url.searchParams.set(k,v);
+        parent.location.replace(url.toString());
+      } catch(e){}
+    }
+    // Click the in-page Streamlit pager so paging is a websocket rerun,
+    // not a full page reload; the URL param is only a fallback.
+    function nav(dir){
+      try {
+        const btn = parent.document.querySelector('.st-key-'+prefix+'_top_'+dir+' button');
+        if (btn) { if (!btn.disabled) btn.click(); return; }
+      } catch(e){}
+      setParam(prefix+'_nav', dir);
+    }
+    root.querySelector('.prev').addEventListener('click', ()=> nav('prev'));
+    root.querySelector('.next').addEventListener('click', ()=> nav('next'));
+    root.querySelector('.go').addEventListener('click', ()=> { const v = gotoEl.value; if(v) setParam(prefix+'_goto', v); });
+    // Held arrow keys fire many repeats per frame; send at most one step each
+    let keyDir = null;
+    function queueKeyNav(dir){
+      if (keyDir === null) {
+        requestAnimationFrame(()=>{ const d = keyDir; keyDir = null; nav(d); });
+      }
+      keyDir = dir;
+    }
+    window.addEventListener('keydown', (e)=>{
+      if (!isActive) return;
+      if (e.key==='ArrowLeft') queueKeyNav('prev');
+      if (e.key==='ArrowRight') queueKeyNav('next');
+      if (e.key==='Enter') {
+        if (document.activeElement === gotoEl) { const v = gotoEl.value; if(v) setParam(prefix+'_goto', v); }
+      }
+    });
+    // React to tab switches instead of polling
+    new MutationObserver(showIfActive).observe(parent.document.body, {
+      subtree: true, attributes: true, attributeFilter: ['aria-selected']
+    });
+    showIfActive();
+  })();
+</script>
+"""
+    )
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _pager_shell(prefix: str, tab_label: str) -> Tuple[str, str]:
+    subs = {"prefix": prefix, "tab": tab_label}
+    return (
+        _PAGER_STYLE_TPL.safe_substitute(subs),
+        _PAGER_SCRIPT_TPL.safe_substitute(subs),
+    )
+
+
+def _pager_body(
+    prefix: str, tab_label: str, page: int, total_pages: int, density: str
+) -> str:
+    return (
+        f'<div id="fixed-pager-{prefix}" data-density="{_density_slug(density)}"'
+        ' style="display:none">'
+        '<button class="prev" title="Prev">&lt; Prev</button>'
+        f'<span class="muted">{tab_label}</span>'
+        f"<span>Page {page} / {total_pages}</span>"
+        '<span class="spacer"></span><label>Go to</label>'
+        f'<input class="goto" type="number" min="1" max="{total_pages}" value="{page}"/>'
+        '<button class="go">Go</button>'
+        '<button class="next" title="Next">Next &gt;</button></div>'
+    )
 
 
 def _inject_fixed_pager(
     prefix: str, tab_label: str, page: int, total_pages: int
 ) -> None:
-    # Size bar using current density
     density = st.session_state.get("ui_density", "Comfortable")
-    nav_h = {"Ultra Compact": 40, "Compact": 44, "Comfortable": 48, "Spacious": 56}.get(
-        density, 48
+    if density not in _PAGER_NAV_H:
+        density = "Comfortable"
+    if _fixed_pager is not None:
+        # Stable key keeps one iframe per tab; reruns only send new props
+        _fixed_pager(
+            prefix=str(prefix),
+            tab=str(tab_label),
+            page=int(page),
+            total=total_pages,
+            density=_density_slug(density),
+            key=f"{prefix}_fixed_pager",
+            on_change=functools.partial(_apply_pager_action, prefix),
+            default=None,
+        )
+        return
+    style, script = _pager_shell(str(prefix), str(tab_label))
+    body = _pager_body(str(prefix), str(tab_label), page, total_pages, density)
+    try:
+        components.v1.html(  # type: ignore[attr-defined]
+            style + body + script, height=_PAGER_NAV_H[density]
+        )
+    except Exception:
+        pass
+
+
+# Shared page cache: one process-global copy for all sessions (no per-session
+# pickling), refreshed in the background while pages are still being viewed.
+_PAGE_TTL = 30.0
+_PAGE_HOT_WINDOW = 60.0
+_SECTION_VERSION_TTL = 10.0
+# Upper bound on pages held across all sessions (many filters x many pages)
+_PAGE_STORE_MAX = 256
+# Counts only move when the library grows, so they outlive page payloads
+_TOTAL_TTL = 300.0
+# (ratingKey, addedAt) of every match, shared by "Select all results" and
+# "Select range" so back-to-back bulk selections walk the library once
+_INDEX_TTL = 60.0
+_INDEX_MAX = 8
+# Items per addedAt PUT when applying a batch date
+_UPDATE_CHUNK = 100
+# Concurrent chunk PUTs when no rate limit is set (well under the
+# client's pool of 32 keep-alive connections)
+_APPLY_WORKERS = 4
+
+# Requested poster width for the table view's 60px rows (2x for HiDPI)
+_TABLE_THUMB_W = 80
+
+# Every item attribute the UI reads; pages are fetched and cached with only these
+_ITEM_FIELDS = (
+    "ratingKey",
+    "title",
+    "year",
+    "addedAt",
+    "thumb",
+    "originallyAvailableAt",
+)
+
+# (base_url, token, section, type, start, size, sort, year, title)
+PageKey = Tuple[str, str, str, str, int, int, str, str, str]
+# (items, total)
+Page = Tuple[Tuple[dict, ...], int]
+
+
+@st.cache_resource(show_spinner=False)
+def _plex(base_url: str, token: str) -> PlexAPI:
+    """One client (and pooled HTTP session) per server/token for all sessions."""
+    return PlexAPI(base_url=base_url, token=token)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_sections(base_url: str, token: str) -> List[dict]:
+    """Library sections change rarely; keep Plex out of every rerun."""
+    return _plex(base_url, token).get_sections()
+
+
+def _plex_filters(year: str, title: str) -> Optional[Dict[str, str]]:
+    """Query filters for Plex; `title=` is a case-insensitive contains match."""
+    filters = {k: v for k, v in (("year", year), ("title", title)) if v}
+    return filters or None
+
+
+def _load_page(key: PageKey) -> Page:
+    base_url, token, section_id, type_id, start, size, sort, year, title = key
+    p = _plex(base_url, token)
+    items, total = p.fetch_items(
+        section_id,
+        type_id,
+        start=start,
+        size=size,
+        sort=sort,
+        filters=_plex_filters(year, title),
+        fields=_ITEM_FIELDS,
     )
-    font_px = {
-        "Ultra Compact": 12,
-        "Compact": 12,
-        "Comfortable": 13,
-        "Spacious": 14,
-    }.get(density, 13)
-    muted_px = max(font_px - 1, 11)
-    pad_v = {"Ultra Compact": 4, "Compact": 6, "Comfortable": 6, "Spacious": 8}.get(
-        density, 6
+    # Frozen: the page is shared by every session reading the store
+    return tuple(items), total
+
+
+def _section_version(
+    store: Dict, base_url: str, token: str, section_id: str
+) -> Optional[str]:
+    """Return the section's change marker (cached briefly), or None."""
+    server = (base_url, token)
+    now = time.monotonic()
+    checked, versions = store["versions"].get(server, (float("-inf"), {}))
+    if now - checked >= _SECTION_VERSION_TTL:
+        try:
+            versions = _plex(base_url, token).section_versions()
+        except Exception:  # noqa: BLE001
+            return None
+        store["versions"][server] = (now, versions)
+    return versions.get(section_id)
+
+
+def _revalidate(store: Dict, key: PageKey) -> Page:
+    """Refresh a page, reusing the cached body if its section is unchanged."""
+    base_url, token, section_id = key[:3]
+    # Read the marker before fetching so a concurrent change forces a refetch
+    version = _section_version(store, base_url, token, section_id)
+    # One read: a concurrent drop/eviction between two lookups would KeyError
+    cached = store["data"].get(key)
+    reused = (
+        version is not None and cached is not None and store["etag"].get(key) == version
     )
-    tpl = Template(
-        """
-        <style>
-          #fixed-pager-$prefix {
-            position: fixed; top: 0; left: 0; right: 0; height: ${nav_h}px;
-            background: rgba(255,255,255,0.9); backdrop-filter: blur(4px);
-            border-bottom: 1px solid #e5e7eb; z-index: 1000;
-            display: flex; align-items: center; gap: 8px; padding: ${pad_v}px 12px; font-family: ui-sans-serif, system-ui; font-size: ${font_px}px;
-          }
-          #fixed-pager-$prefix input { width: 70px; }
-          #fixed-pager-$prefix .spacer { flex: 1; }
-          #fixed-pager-$prefix .muted { color:#6b7280; font-size: ${muted_px}px; }
-          @media (max-width: 640px) { #fixed-pager-$prefix { font-size: ${muted_px}px; } }
-        </style>
-        <div id="fixed-pager-$prefix" style="display:none">
-          <button class="prev" title="Prev">&lt; Prev</button>
-          <span class="muted">$tab</span>
-          <span>Page $page / $total</span>
-          <span class="spacer"></span>
-          <label>Go to</label>
-          <input class="goto" type="number" min="1" max="$max" value="$page"/>
-          <button class="go">Go</button>
-          <button class="next" title="Next">Next &gt;</button>
-        </div>
-        <script>
-          (function(){
-            const tabLabel = "$tab";
-            const prefix = "$prefix";
-            const root = document.getElementById('fixed-pager-'+prefix);
-            function activeTab(){
-              const t = parent.document.querySelector('button[role="tab"][aria-selected="true"]');
-              return t ? t.innerText.trim() : '';
-            }
-            function showIfActive(){ root.style.display = (activeTab()===tabLabel)?'flex':'none'; }
-            function setParam(k,v){
-              try {
-                const url = new URL(parent.location);
-                url.searchParams.set(k,v);
-                parent.location.replace(url.toString());
-              } catch(e){}
-            }
-            root.querySelector('.prev').addEventListener('click', ()=> setParam(prefix+'_nav','prev'));
-            root.querySelector('.next').addEventListener('click', ()=> setParam(prefix+'_nav','next'));
-            root.querySelector('.go').addEventListener('click', ()=> { const v = root.querySelector('.goto').value; if(v) setParam(prefix+'_goto', v); });
-            window.addEventListener('keydown', (e)=>{
-              if (activeTab()!==tabLabel) return;
-              if (e.key==='ArrowLeft') setParam(prefix+'_nav','prev');
-              if (e.key==='ArrowRight') setParam(prefix+'_nav','next');
-              if (e.key==='Enter') {
-                const el = root.querySelector('.goto');
-                if (document.activeElement === el) { const v = el.value; if(v) setParam(prefix+'_goto', v); }
-              }
-            });
-            setInterval(showIfActive, 400);
-            showIfActive();
-          })();
-        </script>
-        """
+    result = cached if reused else _load_page(key)
+    with store["lock"]:
+        store["stats"]["reused" if reused else "fetched"] += 1
+        store["data"][key] = result
+        store["ts"][key] = time.monotonic()
+        store["etag"][key] = version
+        if len(store["data"]) > _PAGE_STORE_MAX:
+            _evict_coldest(store, len(store["data"]) - _PAGE_STORE_MAX)
+        # Every page carries totalSize, so keep the count cache warm for free
+        base_url, token, section_id, type_id, _s, _z, _o, year, title = key
+        store["totals"][(base_url, token, section_id, type_id, year, title)] = (
+            time.monotonic(),
+            result[1],
+        )
+    return result
+
+
+def _cached_total(
+    base_url: str, token: str, section_id: str, type_id: str, year: str, title: str
+) -> int:
+    """Item count for a filtered section/type; refetched at most every 5 minutes."""
+    store = _page_store()
+    tkey = (base_url, token, section_id, type_id, year, title)
+    checked, total = store["totals"].get(tkey, (float("-inf"), 0))
+    if time.monotonic() - checked < _TOTAL_TTL:
+        return total
+    total = _plex(base_url, token).fetch_total(
+        section_id, type_id, filters=_plex_filters(year, title)
     )
-    html = tpl.safe_substitute(
-        prefix=str(prefix),
-        tab=str(tab_label),
-        page=str(page),
-        total=str(total_pages),
-        max=str(max(1, int(total_pages))),
-        nav_h=str(nav_h),
-        font_px=str(font_px),
-        muted_px=str(muted_px),
-        pad_v=str(pad_v),
+    with store["lock"]:
+        store["totals"][tkey] = (time.monotonic(), total)
+    return total
+
+
+class _Index(NamedTuple):
+    """Aligned, read-only arrays over every item matching one filter set."""
+
+    keys: np.ndarray  # ratingKey strings (object dtype)
+    added: np.ndarray  # addedAt as int64, so range masks are vectorized
+
+
+_EMPTY_INDEX = _Index(np.array([], dtype=object), np.array([], dtype=np.int64))
+
+
+def _cached_index(
+    base_url: str, token: str, section_id: str, type_id: str, year: str, title: str
+) -> _Index:
+    """ratingKey/addedAt arrays for every item matching the filters.
+
+    Concurrent callers for the same filters wait on one walk instead of
+    each re-fetching the section.
+    """
+    store = _page_store()
+    ikey = (base_url, token, section_id, type_id, year, title)
+    with store["lock"]:
+        key_lock = store["locks"].setdefault(("index",) + ikey, threading.Lock())
+    with key_lock:
+        checked, index = store["index"].get(ikey, (float("-inf"), _EMPTY_INDEX))
+        if time.monotonic() - checked < _INDEX_TTL:
+            return index
+        items = _plex(base_url, token).fetch_all_fields(
+            section_id,
+            type_id,
+            ("ratingKey", "addedAt"),
+            filters=_plex_filters(year, title),
+        )
+        items = [i for i in items if i.get("ratingKey")]
+        index = _Index(
+            np.array([str(i["ratingKey"]) for i in items], dtype=object),
+            np.fromiter(
+                (int(i.get("addedAt", 0) or 0) for i in items),
+                dtype=np.int64,
+                count=len(items),
+            ),
+        )
+        # Shared across sessions
+        index.keys.setflags(write=False)
+        index.added.setflags(write=False)
+        with store["lock"]:
+            store["index"][ikey] = (time.monotonic(), index)
+            while len(store["index"]) > _INDEX_MAX:
+                oldest = min(store["index"], key=lambda k: store["index"][k][0])
+                store["index"].pop(oldest)
+    return index
+
+
+def _invalidate_section(base_url: str, section_id: str) -> None:
+    """Force the next read of any page in the section to go back to Plex."""
+    store = _page_store()
+    with store["lock"]:
+        for key in [
+            k for k in store["data"] if k[0] == base_url and k[2] == section_id
+        ]:
+            store["ts"].pop(key, None)
+            store["etag"].pop(key, None)
+        for tkey in [
+            t for t in store["totals"] if t[0] == base_url and t[2] == section_id
+        ]:
+            store["totals"].pop(tkey, None)
+        for ikey in [
+            i for i in store["index"] if i[0] == base_url and i[2] == section_id
+        ]:
+            store["index"].pop(ikey, None)
+
+
+def _drop_page(store: Dict, key: PageKey) -> None:
+    # Caller holds store["lock"]
+    for bucket in ("data", "ts", "seen", "locks", "etag"):
+        store[bucket].pop(key, None)
+
+
+def _evict_coldest(store: Dict, count: int) -> None:
+    """Drop the `count` least recently viewed pages (caller holds the lock)."""
+    seen = store["seen"]
+    for key in sorted(store["data"], key=lambda k: seen.get(k, 0.0))[:count]:
+        _drop_page(store, key)
+
+
+def _refresh_pages(store: Dict) -> None:
+    """Revalidate recently viewed pages so foreground reruns rarely block."""
+    while True:
+        time.sleep(_PAGE_TTL / 2)
+        # The thread lives as long as the process; never let one bad pass end it
+        try:
+            _refresh_pass(store)
+        except Exception:  # noqa: BLE001
+            _log.warning("Page refresher pass failed", exc_info=True)
+
+
+def _refresh_pass(store: Dict) -> None:
+    now = time.monotonic()
+    with store["lock"]:
+        for key in [
+            k for k, seen in store["seen"].items() if now - seen > _PAGE_HOT_WINDOW
+        ]:
+            # Cold page: drop it instead of refreshing forever
+            _drop_page(store, key)
+        stale = [
+            k for k in store["seen"] if now - store["ts"].get(k, 0.0) >= _PAGE_TTL / 2
+        ]
+    for key in stale:
+        try:
+            _revalidate(store, key)
+        except Exception:  # noqa: BLE001
+            # Key fields by position; the token (key[1]) stays out of logs
+            _log.debug(
+                "Background refresh failed for section %s (start %s)",
+                key[2],
+                key[4],
+                exc_info=True,
+            )
+
+
+@st.cache_resource(show_spinner=False)
+def _page_store() -> Dict:
+    store: Dict = {
+        "lock": threading.Lock(),
+        "locks": {},
+        "data": {},
+        "ts": {},
+        "seen": {},
+        "etag": {},
+        "versions": {},
+        "totals": {},
+        "index": {},
+        # Lookup counters (updated under "lock"), shown under Settings
+        "stats": {"hits": 0, "misses": 0, "fetched": 0, "reused": 0},
+    }
+    threading.Thread(target=_refresh_pages, args=(store,), daemon=True).start()
+    return store
+
+
+def _page_store_summary() -> str:
+    """One-line hit/miss summary of the shared page store."""
+    store = _page_store()
+    with store["lock"]:
+        stats = dict(store["stats"])
+    lookups = stats["hits"] + stats["misses"]
+    rate = f"{stats['hits'] * 100 // lookups}%" if lookups else "n/a"
+    return (
+        f"Page cache: {len(store['data'])} pages held, "
+        f"{stats['hits']} hits / {stats['misses']} misses ({rate} hit rate); "
+        f"{stats['fetched']} fetched, {stats['reused']} reused unchanged "
+        f"(TTL {_PAGE_TTL:.0f}s, max {_PAGE_STORE_MAX})"
     )
-    try:
-        components.v1.html(html, height=nav_h)  # type: ignore[attr-defined]
-    except Exception:
-        pass
 
 
-@st.cache_data(show_spinner=False, ttl=30)
 def _cached_fetch(
     base_url: str,
     token: str,
@@ -303,51 +790,193 @@ def _cached_fetch(
     size: int,
     sort: str,
     year: str,
-) -> Tuple[List[dict], int]:
-    p = PlexAPI(base_url=base_url, token=token)
-    filters = {"year": year} if year else None
-    return p.fetch_items(
-        section_id, type_id, start=start, size=size, sort=sort, filters=filters
+    title: str,
+) -> Page:
+    """Return a page from the shared store, fetching from Plex on a miss.
+
+    The returned payload is shared across sessions, so the item sequence is a
+    tuple; the dicts inside must not be mutated either.
+    """
+    store = _page_store()
+    key: PageKey = (
+        base_url,
+        token,
+        section_id,
+        type_id,
+        start,
+        size,
+        sort,
+        year,
+        title,
     )
+    stats = store["stats"]
+    with store["lock"]:
+        # The refresher iterates "seen" under this lock
+        store["seen"][key] = time.monotonic()
+        page = _fresh_page(store, key)
+        if page is not None:
+            stats["hits"] += 1
+            return page
+        key_lock = store["locks"].setdefault(key, threading.Lock())
+    with key_lock:
+        with store["lock"]:
+            # Another session may have fetched it while we waited
+            page = _fresh_page(store, key)
+            stats["hits" if page is not None else "misses"] += 1
+        return page if page is not None else _revalidate(store, key)
+
+
+def _fresh_page(store: Dict, key: PageKey) -> Optional[Page]:
+    """The stored page if still within its TTL, else None.
+
+    A page dropped or evicted concurrently reads as a miss.
+    """
+    if time.monotonic() - store["ts"].get(key, float("-inf")) >= _PAGE_TTL:
+        return None
+    return store["data"].get(key)
+
+
+@st.cache_resource(show_spinner=False)
+def _prefetch_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="plex-prefetch")
+
+
+def _prefetch_adjacent(
+    prefix: str,
+    base_url: str,
+    token: str,
+    section_id: str,
+    type_id: str,
+    start: int,
+    size: int,
+    sort: str,
+    year: str,
+    title: str,
+    total: int,
+) -> None:
+    """Warm the previous/next pages in the shared store (fire-and-forget)."""
+    state_key = f"{prefix}_prefetch"
+    stream = (base_url, section_id, type_id, size, sort, year, title)
+    prev_stream, prev_futures = st.session_state.get(state_key, (None, []))
+    if prev_stream != stream:
+        # Filters changed: pending pages belong to a stale result set
+        for fut in prev_futures:
+            fut.cancel()
+    futures = []
+    pool = _prefetch_pool()
+    store = _page_store()
+    now = time.monotonic()
+    for adj in (start - size, start + size):
+        key = (base_url, token, section_id, type_id, adj, size, sort, year, title)
+        if now - store["ts"].get(key, float("-inf")) < _PAGE_TTL:
+            # Already warm (e.g. a rerun on the same page); skip the handoff
+            continue
+        if 0 <= adj < total:
+            futures.append(
+                pool.submit(
+                    _cached_fetch,
+                    base_url,
+                    token,
+                    section_id,
+                    type_id,
+                    adj,
+                    size,
+                    sort,
+                    year,
+                    title,
+                )
+            )
+    st.session_state[state_key] = (stream, futures)
+
+
+# One entry per tab: prefix, label, type id, default section, noun
+_TAB_SPECS: Tuple[Tuple[str, str, str, str, str], ...] = (
+    ("movie", "Movies", "1", "1", "movies"),
+    ("show", "TV Series", "2", "2", "shows"),  # TV Series == shows (type=2)
+)
+_TAB_PREFIXES = tuple(f"{spec[0]}_" for spec in _TAB_SPECS)
+
+# Keyed value widgets of the range selector, kept while its expander is shut
+_RANGE_WIDGET_SUFFIXES = ("_preset", "_range_from", "_range_to")
+# Every keyed value widget a tab renders, less buttons (their state cannot be
+# assigned) and the per-row/editor keys. Kept while the tab is hidden, so add
+# new tab widgets here.
+_TAB_WIDGET_SUFFIXES = (
+    "_section",
+    "_section_label",
+    "_page_size",
+    "_sort",
+    "_year_filter",
+    "_title_filter_raw",
+    "_show_images",
+    "_lock_added",
+    "_select_all",
+    "_batch_date",
+    "_max_per_min",
+    "_legacy_view",
+    "_range_open",
+) + _RANGE_WIDGET_SUFFIXES
+
+# Immutable per-session defaults. Mutable containers (e.g. the selection
+# sets) are created per session in _init_state so no object is shared.
+_DEFAULTS: Tuple[Tuple[str, Any], ...] = (
+    ("movie_page", 1),
+    ("movie_page_size", 100),
+    ("movie_show_images", True),
+    ("movie_sort", "addedAt:desc"),
+    ("movie_year_filter", ""),
+    ("movie_title_filter", ""),
+    ("movie_title_filter_raw", ""),
+    ("movie_section", "1"),
+    ("movie_lock_added", True),
+    ("movie_legacy_view", False),
+    ("show_page", 1),
+    ("show_page_size", 100),
+    ("show_show_images", True),
+    ("show_sort", "addedAt:desc"),
+    ("show_year_filter", ""),
+    ("show_title_filter", ""),
+    ("show_title_filter_raw", ""),
+    ("show_section", "2"),
+    ("show_lock_added", True),
+    ("show_legacy_view", False),
+    ("ui_density", "Comfortable"),
+)
+
+
+_DEFAULT_KEYS = frozenset(k for k, _v in _DEFAULTS) | {
+    f"{prefix}selected" for prefix in _TAB_PREFIXES
+}
+_DEFAULT_MAP = dict(_DEFAULTS)
 
 
 def _init_state() -> None:
-    defaults = {
-        "movie_page": 1,
-        "movie_page_size": 100,
-        "movie_selected": {},
-        "movie_show_images": True,
-        "movie_sort": "addedAt:desc",
-        "movie_year_filter": "",
-        "movie_title_filter": "",
-        "movie_section": "1",
-        "movie_lock_added": True,
-        "show_page": 1,
-        "show_page_size": 100,
-        "show_selected": {},
-        "show_show_images": True,
-        "show_sort": "addedAt:desc",
-        "show_year_filter": "",
-        "show_title_filter": "",
-        "show_section": "2",
-        "show_lock_added": True,
-        "ui_density": "Comfortable",
-    }
-    for k, v in defaults.items():
-        st.session_state.setdefault(k, v)
+    ss = st.session_state
+    # One keys() snapshot instead of a proxy call per default; after the first
+    # run nothing is missing and this is a single set difference
+    missing = _DEFAULT_KEYS.difference(ss.keys())
+    for k in missing:
+        ss[k] = set() if k.endswith("_selected") else _DEFAULT_MAP[k]
 
 
 def _apply_density() -> None:
     """Apply global, density-aware CSS tokens for the whole UI.
 
     Scales spacing, control sizes, typography, and chrome consistently.
-    Keeps legacy values working for "Ultra Compact".
+    Keeps legacy values working for "Ultra Compact". This is the app's only
+    stylesheet: one cached string per density, emitted once per run.
     """
     density = st.session_state.get("ui_density", "Comfortable")
 
-    if density not in {"Ultra Compact", "Compact", "Comfortable", "Spacious"}:
+    if density not in _DENSITIES:
         density = "Comfortable"
 
+    st.markdown(_density_css(density) + _density_js(density), unsafe_allow_html=True)
+
+
+@functools.lru_cache(maxsize=4)
+def _density_css(density: str) -> str:
+    """The <style> block for one density (only four ever get built)."""
     tokens = {
         "Ultra Compact": {
             "scale": 0.8,
@@ -426,16 +1055,53 @@ def _apply_density() -> None:
       div[data-testid="stHorizontalBlock"] > div {{ padding-right: var(--space-2); }}
       div[data-testid="stVerticalBlock"] > div {{ margin-bottom: var(--space-3); }}
     </style>
+    """
+    return css
+
+
+@functools.lru_cache(maxsize=4)
+def _density_js(density: str) -> str:
+    return f"""
     <script>
       try {{ parent.document.documentElement.dataset.density = '{density}'.toLowerCase().replace(' ', '-'); }} catch(e) {{}}
-      try {{ localStorage.setItem('ui_density', '{density}'); }} catch(e) {{}}
+      try {{ if (localStorage.getItem('ui_density') !== '{density}') localStorage.setItem('ui_density', '{density}'); }} catch(e) {{}}
     </script>
     """
 
-    st.markdown(css, unsafe_allow_html=True)
 
+class _Cfg(NamedTuple):
+    """One tab's filter/paging state, normalized once per run by _controls."""
+
+    section_id: str
+    page: int
+    page_size: int
+    sort: str
+    year: str
+    title: str
+    show_images: bool
+    lock: bool
 
-def _controls(prefix: str, *, sections: List[dict], required_type: str) -> Dict:
+
+@functools.lru_cache(maxsize=16)
+def _section_options(
+    sections: Tuple[Tuple[str, str, Optional[str]], ...], required_type: str
+) -> Tuple[Tuple[str, ...], Dict[str, str], Dict[str, int]]:
+    """(labels, label -> key, key -> label index) for the tab's section type.
+
+    The section list only changes every few minutes, so both tabs reuse
+    these across reruns. Callers must not mutate the returned dicts.
+    """
+    wanted = "movie" if required_type == "1" else "show"
+    label_by_key = {
+        key: f"{title} (#{key})" for key, title, kind in sections if kind == wanted
+    }
+    labels = tuple(label_by_key.values())
+    label_to_key = {lbl: key for key, lbl in label_by_key.items()}
+    key_to_idx = {key: i for i, key in enumerate(label_by_key)}
+    return labels, label_to_key, key_to_idx
+
+
+def _controls(prefix: str, *, sections: List[dict], required_type: str) -> _Cfg:
     section_key = f"{prefix}_section"
     page_key = f"{prefix}_page"
     page_size_key = f"{prefix}_page_size"
@@ -446,80 +1112,83 @@ def _controls(prefix: str, *, sections: List[dict], required_type: str) -> Dict:
     lock_key = f"{prefix}_lock_added"
 
     # Section dropdown (filtered by type)
-    typed = [
-        s
-        for s in sections
-        if s.get("type") == ("movie" if required_type == "1" else "show")
-    ]
-    labels = [f"{s['title']} (#{s['key']})" for s in typed]
-    label_to_key = {f"{s['title']} (#{s['key']})": s["key"] for s in typed}
-
-    r1c1, r1c2, r1c3, r1c4, r1c5, r1c6 = st.columns([2.4, 1, 1.2, 1, 1.4, 1])
-    with r1c1:
-        if labels:
-            # preserve current selection if possible
-            curr = st.session_state.get(section_key)
-            try:
-                idx = labels.index(
-                    next(lbl for lbl in labels if label_to_key[lbl] == curr)
+    labels, label_to_key, key_to_idx = _section_options(
+        tuple((s["key"], s["title"], s.get("type")) for s in sections), required_type
+    )
+
+    # The query controls sit in a form so adjusting several of them costs a
+    # single rerun (and fetch) on "Apply" instead of one per change
+    with st.form(f"{prefix}_filters", clear_on_submit=False, border=False):
+        r1c1, r1c2, r1c3, r1c4, r1c5, r1c6 = st.columns(
+            [2.4, 1, 1.2, 1, 1.4, 1], vertical_alignment="bottom"
+        )
+        with r1c1:
+            if labels:
+                # preserve current selection if possible
+                idx = key_to_idx.get(st.session_state.get(section_key), 0)
+                chosen = st.selectbox(
+                    "Section", options=labels, index=idx, key=f"{prefix}_section_label"
                 )
-            except Exception:
-                idx = 0
-            chosen = st.selectbox(
-                "Section", options=labels, index=idx, key=f"{prefix}_section_label"
+                st.session_state[section_key] = label_to_key[chosen]
+            else:
+                st.text_input("Section ID", key=section_key)
+        with r1c2:
+            st.selectbox("Page Size", [50, 100, 200], key=page_size_key)
+        with r1c3:
+            st.selectbox(
+                "Sort",
+                [
+                    "addedAt:desc",
+                    "addedAt:asc",
+                    "titleSort:asc",
+                    "titleSort:desc",
+                    "year:desc",
+                    "year:asc",
+                ],
+                key=sort_key,
+            )
+        with r1c4:
+            st.text_input("Year", key=year_key, placeholder="e.g. 2021")
+        with r1c5:
+            st.text_input("Title contains", key=f"{title_key}_raw")
+        with r1c6:
+            st.form_submit_button(
+                "Apply Filters",
+                on_click=_apply_filters,
+                args=(prefix,),
             )
-            st.session_state[section_key] = label_to_key[chosen]
-        else:
-            st.text_input("Section ID", key=section_key)
-    with r1c2:
-        st.selectbox("Page Size", [50, 100, 200], key=page_size_key)
-    with r1c3:
-        st.selectbox(
-            "Sort",
-            [
-                "addedAt:desc",
-                "addedAt:asc",
-                "titleSort:asc",
-                "titleSort:desc",
-                "year:desc",
-                "year:asc",
-            ],
-            key=sort_key,
-        )
-    with r1c4:
-        st.text_input("Year", key=year_key, placeholder="e.g. 2021")
-    with r1c5:
-        st.text_input("Title contains", key=title_key)
-    with r1c6:
-        st.checkbox("Show images", key=images_key)
 
-    r2c1, r2c2, r2c3 = st.columns([1, 1, 3])
+    r2c1, r2c2, r2c3, r2c4 = st.columns([1, 1, 1, 2])
     with r2c1:
-        st.checkbox("Lock added date", key=lock_key)
+        st.checkbox("Show images", key=images_key)
     with r2c2:
-        if st.button("Reset Filters", key=f"{prefix}_reset"):
-            st.session_state[year_key] = ""
-            st.session_state[title_key] = ""
-            st.session_state[sort_key] = "addedAt:desc"
-            st.session_state[page_key] = 1
+        st.checkbox("Lock added date", key=lock_key)
     with r2c3:
+        st.button(
+            "Reset Filters",
+            key=f"{prefix}_reset",
+            on_click=_reset_filters,
+            args=(prefix,),
+        )
+    with r2c4:
         st.caption("Tip: Use the pager to jump to any page.")
 
-    return {
-        "section_id": st.session_state[section_key],
-        "page": st.session_state[page_key],
-        "page_size": st.session_state[page_size_key],
-        "sort": st.session_state[sort_key],
-        "year": st.session_state[year_key],
-        "title": st.session_state[title_key],
-        "show_images": st.session_state[images_key],
-        "lock": st.session_state[lock_key],
-    }
+    ss = st.session_state
+    return _Cfg(
+        section_id=ss[section_key],
+        page=int(ss[page_key]),
+        page_size=int(ss[page_size_key]),
+        sort=ss[sort_key],
+        year=ss[year_key] or "",
+        title=(ss[title_key] or "").strip().lower(),
+        show_images=ss[images_key],
+        lock=ss[lock_key],
+    )
 
 
 def _render_items(
     plex: PlexAPI,
-    items: List[dict],
+    items: Sequence[dict],
     *,
     type_id: str,
     select_key: str,
@@ -527,15 +1196,26 @@ def _render_items(
     show_images: bool,
     lock_added: bool,
     section_id: str,
-    sort: str,
     year: str,
     title_filter: str,
-    page_size: int,
 ) -> None:
     density = st.session_state.get("ui_density", "Comfortable")
     cols_widths = [0.16, 0.84] if density == "Compact" else [0.2, 0.8]
     poster_w = 80 if density == "Compact" else 110
-    selected: Dict[str, bool] = st.session_state.setdefault(select_key, {})
+    selected: Set[str] = st.session_state.setdefault(select_key, set())
+    # Snapshot to detect bulk (non-checkbox) changes made during this run
+    selected_before = frozenset(selected)
+
+    _show_notices(key_prefix)
+    pending = st.session_state.get(f"{key_prefix}_pending")
+    if pending:
+        st.button(
+            f"Save {len(pending)} pending",
+            key=f"{key_prefix}_save_pending",
+            type="primary",
+            on_click=_flush_pending,
+            args=(key_prefix, plex),
+        )
 
     # Batch controls
     left, mid, right = st.columns([2, 3, 2])
@@ -546,40 +1226,21 @@ def _render_items(
         b1, b2, b3 = st.columns(3)
         with b1:
             if st.button("Select all results", key=f"{key_prefix}_select_all_results"):
-                progress = st.progress(0)
-                selected_count = 0
-                try:
-                    start = 0
-                    total_known = None
-                    while True:
-                        batch_items, total = plex.fetch_items(
-                            section_id,
-                            type_id,
-                            start=start,
-                            size=page_size,
-                            sort=sort,
-                            filters=({"year": year} if year else None),
-                        )
-                        total_known = total
-                        if title_filter:
-                            batch_items = [
-                                i
-                                for i in batch_items
-                                if title_filter in (i.get("title", "").lower())
-                            ]
-                        for it in batch_items:
-                            rk = str(it.get("ratingKey"))
-                            if rk:
-                                selected[rk] = True
-                                selected_count += 1
-                        start += page_size
-                        if start >= total:
-                            break
-                        progress.progress(min(100, int(start * 100 / max(1, total))))
-                finally:
-                    progress.progress(100)
+                total_known = _cached_total(
+                    plex.base_url, plex.token, section_id, type_id, year, title_filter
+                )
+                with st.spinner(f"Collecting up to {total_known} items…"):
+                    index = _cached_index(
+                        plex.base_url,
+                        plex.token,
+                        section_id,
+                        type_id,
+                        year,
+                        title_filter,
+                    )
+                selected.update(index.keys.tolist())
                 st.success(
-                    f"Selected {selected_count} items across results (total ~{total_known})."
+                    f"Selected {len(index.keys)} items across results (total ~{total_known})."
                 )
         with b2:
             if st.button("Clear all", key=f"{key_prefix}_clear_all"):
@@ -587,10 +1248,7 @@ def _render_items(
                 st.success("Cleared all selections.")
         with b3:
             if st.button("Clear page", key=f"{key_prefix}_clear_page"):
-                for it in items:
-                    rk = str(it.get("ratingKey"))
-                    if rk in selected:
-                        selected[rk] = False
+                selected.difference_update(str(it.get("ratingKey")) for it in items)
                 st.success("Cleared selections on this page.")
     with mid:
         batch_date = st.date_input(
@@ -605,80 +1263,211 @@ def _render_items(
         )
     with right:
         if st.button("Apply to selected", key=f"{key_prefix}_apply_batch"):
-            keys = [k for k, v in selected.items() if v]
+            keys = list(selected)
             if not keys:
                 st.warning("No items selected.")
             else:
-                new_unix = int(
-                    datetime.datetime.combine(batch_date, datetime.time.min).timestamp()
-                )
+                new_unix = _date_to_unix(batch_date)
                 total_sel = len(keys)
                 progress = st.progress(0)
                 successes = 0
                 per_item_sleep = (
                     (60.0 / max_per_min) if max_per_min and max_per_min > 0 else 0.0
                 )
-                for idx, rating_key in enumerate(keys, start=1):
-                    last_err = None
-                    attempts = 0
-                    while attempts < 4:
-                        try:
-                            plex.update_added_date(
-                                section_id,
-                                rating_key,
-                                type_id,
-                                new_unix,
-                                lock=lock_added,
-                            )
-                            successes += 1
-                            last_err = None
-                            break
-                        except Exception as e:  # noqa: BLE001
-                            attempts += 1
-                            last_err = e
-                            time.sleep(min(8, 0.5 * (2 ** (attempts - 1))))
-                    if last_err is not None:
-                        st.error(f"Failed updating id={rating_key}: {last_err}")
-                    progress.progress(int(idx * 100 / total_sel))
+                # Throttled runs send at most a minute's budget per request
+                step = (
+                    min(_UPDATE_CHUNK, max_per_min) if per_item_sleep else _UPDATE_CHUNK
+                )
+                chunks = [keys[o : o + step] for o in range(0, total_sel, step)]
+                args = (plex, section_id, type_id, new_unix, lock_added)
+                done = 0
+                last_pct = 0
+                # Each request waits for its slot first, so nothing sleeps
+                # after the last chunk and request time counts toward the gap
+                gate = RateGate(per_item_sleep)
+
+                def _paced_put(chunk: List[str]) -> Optional[Exception]:
+                    gate.wait(len(chunk))
+                    return _put_chunk(chunk, *args)
+
+                with ThreadPoolExecutor(max_workers=_APPLY_WORKERS) as pool:
                     if per_item_sleep:
-                        time.sleep(per_item_sleep)
+                        # Throttled: one request at a time
+                        results = ((c, _paced_put(c)) for c in chunks)
+                    else:
+                        futures = {pool.submit(_put_chunk, c, *args): c for c in chunks}
+                        results = (
+                            (futures[f], f.result()) for f in as_completed(futures)
+                        )
+                    for chunk, err in results:
+                        if err is None:
+                            successes += len(chunk)
+                        else:
+                            # Retry item by item so one bad id doesn't sink
+                            # the rest of the chunk
+                            successes += _update_each(
+                                chunk,
+                                *args,
+                                pool=None if per_item_sleep else pool,
+                                gate=gate,
+                            )
+                        done += len(chunk)
+                        pct = done * 100 // total_sel
+                        if pct != last_pct:
+                            progress.progress(pct)
+                            last_pct = pct
+                if successes:
+                    _invalidate_section(plex.base_url, section_id)
                 st.success(f"Updated {successes}/{total_sel} items.")
 
     # Selection summary
-    total_selected = sum(1 for v in selected.values() if v)
-    st.caption(f"Selected: {total_selected}")
+    sum_l, sum_r = st.columns([4, 1])
+    with sum_l:
+        st.caption(f"Selected: {len(selected)}")
+    with sum_r:
+        legacy = st.toggle("Legacy view", key=f"{key_prefix}_legacy_view")
 
     # Date range selection (advanced)
-    with st.expander("Select by Added date range", expanded=False):
-        presets = st.columns([1, 1, 1, 1, 1, 1, 1])
-        today = datetime.date.today()
-        # Preset handlers
-        preset_actions = {
-            "Last 7": (today - datetime.timedelta(days=7), today),
-            "Last 30": (today - datetime.timedelta(days=30), today),
-            "Last 90": (today - datetime.timedelta(days=90), today),
-            "Last 365": (today - datetime.timedelta(days=365), today),
-            "This Year": (datetime.date(today.year, 1, 1), today),
-        }
-        keys = list(preset_actions.keys())
-        for i, name in enumerate(keys):
-            with presets[i]:
-                if st.button(name, key=f"{key_prefix}_preset_{name}"):
-                    start, end = preset_actions[name]
-                    st.session_state[f"{key_prefix}_range_from"] = start
-                    st.session_state[f"{key_prefix}_range_to"] = end
-        with presets[-2]:
-            if st.button("Older >1y", key=f"{key_prefix}_preset_older"):
-                st.session_state[
-                    f"{key_prefix}_range_from"
-                ] = today - datetime.timedelta(days=365 * 50)
-                st.session_state[f"{key_prefix}_range_to"] = today - datetime.timedelta(
-                    days=365
+    _render_range_selector(
+        plex,
+        selected,
+        key_prefix=key_prefix,
+        type_id=type_id,
+        section_id=section_id,
+        year=year,
+        title_filter=title_filter,
+    )
+
+    if page_select_all:
+        # One set update for the page; both views then just read `selected`
+        selected.update(str(it.get("ratingKey")) for it in items)
+
+    if not legacy:
+        _render_table(
+            plex,
+            items,
+            selected,
+            key_prefix=key_prefix,
+            type_id=type_id,
+            section_id=section_id,
+            lock_added=lock_added,
+            show_images=show_images,
+        )
+        return
+
+    # Render list (legacy view: one set of widgets per item)
+    bulk_changed = selected != selected_before
+    # Title and info chips for every row, built up front: one markdown per row
+    rows_html = [_row_html(it) for it in items]
+    # Checkbox values for this page; folded into `selected` once, after the loop
+    page_checked: Set[str] = set()
+    for item, row_html in zip(items, rows_html):
+        rating_key = str(item.get("ratingKey"))
+        cols = st.columns(cols_widths)
+        with cols[0]:
+            checked = rating_key in selected
+            sel_key = f"{key_prefix}_sel_{rating_key}"
+            if sel_key not in st.session_state or (
+                bulk_changed and checked != (rating_key in selected_before)
+            ):
+                # Seed/override widget state (it takes precedence over `value`)
+                st.session_state[sel_key] = checked
+            if st.checkbox("Select", key=sel_key):
+                page_checked.add(rating_key)
+            if show_images:
+                thumb = item.get("thumb")
+                # 2x the display width so posters stay sharp on HiDPI screens
+                url = plex.thumb_url(thumb, width=poster_w * 2)
+                if url:
+                    # Let the browser fetch posters lazily as they scroll in
+                    st.markdown(
+                        f'<img src="{html.escape(url)}" width="{poster_w}" '
+                        'loading="lazy" decoding="async" fetchpriority="low" '
+                        'style="border-radius:var(--radius)">',
+                        unsafe_allow_html=True,
+                    )
+        with cols[1]:
+            title = item.get("title", "Unknown")
+            st.markdown(row_html, unsafe_allow_html=True)
+
+            # Added (inline editable)
+            date_key = f"{key_prefix}_date_{rating_key}"
+
+            date_kwargs = {}
+            if date_key not in st.session_state:
+                # Widget state wins after the first run; only convert for seeding
+                added_at = item.get("addedAt")
+                date_kwargs["value"] = (
+                    _unix_to_date(int(added_at)) if added_at else datetime.date.today()
                 )
-        with presets[-1]:
-            if st.button("Clear", key=f"{key_prefix}_preset_clear"):
-                st.session_state.pop(f"{key_prefix}_range_from", None)
-                st.session_state.pop(f"{key_prefix}_range_to", None)
+            st.date_input(
+                "Added",
+                key=date_key,
+                on_change=_queue_inline_date,
+                args=(
+                    key_prefix,
+                    rating_key,
+                    date_key,
+                    title,
+                    section_id,
+                    type_id,
+                    lock_added,
+                ),
+                **date_kwargs,
+            )
+
+    page_keys = {str(it.get("ratingKey")) for it in items}
+    added = page_checked - selected
+    removed = (page_keys - page_checked) & selected
+    if added or removed:
+        selected |= added
+        selected -= removed
+
+
+def _render_range_selector(
+    plex: PlexAPI,
+    selected: Set[str],
+    *,
+    key_prefix: str,
+    type_id: str,
+    section_id: str,
+    year: str,
+    title_filter: str,
+) -> None:
+    range_keys = tuple(f"{key_prefix}{suffix}" for suffix in _RANGE_WIDGET_SUFFIXES)
+    try:
+        # Track whether it is open so a collapsed expander mounts no widgets
+        expander = st.expander(
+            "Select by Added date range",
+            expanded=False,
+            key=f"{key_prefix}_range_open",
+            on_change="rerun",
+        )
+    except TypeError:
+        expander = st.expander("Select by Added date range", expanded=False)
+    if getattr(expander, "open", None) is False:
+        for k in range_keys:
+            if k in st.session_state:
+                st.session_state[k] = st.session_state[k]
+        return
+    with expander:
+        today = datetime.date.today()
+        pr_l, pr_r = st.columns([5, 1])
+        with pr_l:
+            st.radio(
+                "Preset",
+                list(_RANGE_PRESETS),
+                horizontal=True,
+                key=f"{key_prefix}_preset",
+                label_visibility="collapsed",
+            )
+        with pr_r:
+            st.button(
+                "Apply preset",
+                key=f"{key_prefix}_apply_preset",
+                on_click=_apply_range_preset,
+                args=(key_prefix,),
+            )
 
         rc1, rc2 = st.columns(2)
         with rc1:
@@ -698,46 +1487,27 @@ def _render_items(
         act1, act2 = st.columns(2)
 
         def _select_range(select: bool):
-            start_ts = int(
-                datetime.datetime.combine(range_from, datetime.time.min).timestamp()
-            )
-            end_ts = int(
-                datetime.datetime.combine(range_to, datetime.time.max).timestamp()
-            )
-            progress = st.progress(0)
-            touched = 0
-            try:
-                start = 0
-                while True:
-                    batch_items, total = plex.fetch_items(
-                        section_id,
-                        type_id,
-                        start=start,
-                        size=page_size,
-                        sort=sort,
-                        filters=({"year": year} if year else None),
-                    )
-                    if title_filter:
-                        batch_items = [
-                            i
-                            for i in batch_items
-                            if title_filter in (i.get("title", "").lower())
-                        ]
-                    for it in batch_items:
-                        at = int(it.get("addedAt", 0) or 0)
-                        if start_ts <= at <= end_ts:
-                            rk = str(it.get("ratingKey"))
-                            if rk:
-                                selected[rk] = select
-                                touched += 1
-                    start += page_size
-                    if start >= total:
-                        break
-                    progress.progress(min(100, int(start * 100 / max(1, total))))
-            finally:
-                progress.progress(100)
+            start_ts = _date_to_unix(range_from)
+            # Last second of range_to (local midnight of the next day, minus 1)
+            end_ts = _date_to_unix(range_to + datetime.timedelta(days=1)) - 1
+            with st.spinner("Collecting items in range…"):
+                index = _cached_index(
+                    plex.base_url,
+                    plex.token,
+                    section_id,
+                    type_id,
+                    year,
+                    title_filter,
+                )
+            in_range = (index.added >= start_ts) & (index.added <= end_ts)
+            matched = index.keys[in_range].tolist()
+            if select:
+                selected.update(matched)
+            else:
+                selected.difference_update(matched)
             st.success(
-                ("Selected" if select else "Deselected") + f" {touched} items in range."
+                ("Selected" if select else "Deselected")
+                + f" {len(matched)} items in range."
             )
 
         with act1:
@@ -747,70 +1517,318 @@ def _render_items(
             if st.button("Deselect range", key=f"{key_prefix}_deselect_range"):
                 _select_range(False)
 
-    # Render list
-    for item in items:
-        rating_key = str(item.get("ratingKey"))
-        cols = st.columns(cols_widths)
-        with cols[0]:
-            checked = page_select_all or selected.get(rating_key, False)
-            sel = st.checkbox(
-                "Select", key=f"{key_prefix}_sel_{rating_key}", value=checked
-            )
-            selected[rating_key] = sel
-            if show_images:
-                thumb = item.get("thumb")
-                url = plex.thumb_url(thumb)
-                if url:
-                    st.image(url, width=poster_w)
-        with cols[1]:
-            title = item.get("title", "Unknown")
-            year = item.get("year")
-            rel = item.get("originallyAvailableAt") or "-"
-            display = f"{title} ({year})" if year else title
-            st.markdown(
-                f"<div class='title-row'><h3>{display}</h3></div>",
-                unsafe_allow_html=True,
-            )
 
-            # Added (inline editable)
-            added_at = item.get("addedAt")
-            if added_at:
-                added_dt = datetime.datetime.fromtimestamp(int(added_at))
-            else:
-                added_dt = datetime.datetime.now()
+def _notify(prefix: str, kind: str, message: str) -> None:
+    """Queue a message from a callback for _render_items to show.
 
-            date_key = f"{key_prefix}_date_{rating_key}"
+    Elements created in a callback of a fragment rerun would land at the top
+    of the app, replacing the header row, instead of inside the tab.
+    """
+    st.session_state.setdefault(f"{prefix}_notices", []).append((kind, message))
 
-            def _on_change_inline(rk=rating_key):
-                try:
-                    d = st.session_state[date_key]
-                    new_unix = int(
-                        datetime.datetime.combine(d, datetime.time.min).timestamp()
-                    )
-                    plex.update_added_date(
-                        section_id, rk, type_id, new_unix, lock=lock_added
-                    )
-                    st.toast(f"Saved {title}") if hasattr(st, "toast") else st.success(
-                        f"Saved {title}"
-                    )
-                except Exception as e:  # noqa: BLE001
-                    st.error(f"Failed to save {title}: {e}")
 
-            date_kwargs = {}
-            if date_key not in st.session_state:
-                date_kwargs["value"] = added_dt.date()
-            st.date_input(
-                "Added", key=date_key, on_change=_on_change_inline, **date_kwargs
-            )
+def _show_notices(prefix: str) -> None:
+    for kind, message in st.session_state.pop(f"{prefix}_notices", ()):
+        # kind is "error" or "toast"
+        getattr(st, kind)(message)
+
+
+# ratingKey -> (section_id, type_id, lock, new_unix) as of the edit
+_Pending = Dict[str, Tuple[str, str, bool, int]]
+
+
+def _queue_inline_date(
+    prefix: str,
+    rating_key: str,
+    date_key: str,
+    title: str,
+    section_id: str,
+    type_id: str,
+    lock: bool,
+) -> None:
+    """on_change for a row's date: buffer it until "Save pending" is clicked.
 
-            # Secondary info chips
-            st.markdown(
-                f"<span class='chip'>Release {rel}</span> <span class='chip'>ID {rating_key}</span>",
-                unsafe_allow_html=True,
+    The section and lock setting are captured with the edit, so switching
+    sections before saving still writes to the item's own section.
+    """
+    pending: _Pending = st.session_state.setdefault(f"{prefix}_pending", {})
+    new_unix = _date_to_unix(st.session_state[date_key])
+    pending[rating_key] = (section_id, type_id, lock, new_unix)
+    _notify(prefix, "toast", f"Queued {title}")
+
+
+def _flush_pending(prefix: str, plex: PlexAPI) -> None:
+    """on_click: write buffered inline dates, one bulk PUT per section and date."""
+    pending: _Pending = st.session_state.get(f"{prefix}_pending", {})
+    groups: Dict[Tuple[str, str, bool, int], List[str]] = {}
+    for rk, target in pending.items():
+        groups.setdefault(target, []).append(rk)
+    saved = 0
+    touched: Set[str] = set()
+    for (section_id, type_id, lock, new_unix), keys in groups.items():
+        err = _put_chunk(keys, plex, section_id, type_id, new_unix, lock)
+        if err is not None:
+            _notify(prefix, "error", f"Failed to save {len(keys)} items: {err}")
+            continue
+        for rk in keys:
+            pending.pop(rk, None)
+        saved += len(keys)
+        touched.add(section_id)
+    for section_id in touched:
+        _invalidate_section(plex.base_url, section_id)
+    if saved:
+        _notify(prefix, "toast", f"Saved {saved} items")
+
+
+# Preset name -> (days back for "From", days back for "To"); None = special
+_RANGE_PRESETS: Dict[str, Optional[Tuple[int, int]]] = {
+    "Last 7": (7, 0),
+    "Last 30": (30, 0),
+    "Last 90": (90, 0),
+    "Last 365": (365, 0),
+    "This Year": None,
+    "Older >1y": (365 * 50, 365),
+    "Clear": None,
+}
+
+
+def _apply_range_preset(prefix: str) -> None:
+    # on_click, so the From/To widgets pick the new values up when created
+    ss = st.session_state
+    name = ss.get(f"{prefix}_preset")
+    today = datetime.date.today()
+    if name == "Clear":
+        ss.pop(f"{prefix}_range_from", None)
+        ss.pop(f"{prefix}_range_to", None)
+        return
+    if name == "This Year":
+        start, end = datetime.date(today.year, 1, 1), today
+    elif name in _RANGE_PRESETS:
+        back_from, back_to = _RANGE_PRESETS[name]
+        start = today - datetime.timedelta(days=back_from)
+        end = today - datetime.timedelta(days=back_to)
+    else:
+        return
+    ss[f"{prefix}_range_from"] = start
+    ss[f"{prefix}_range_to"] = end
+
+
+def _put_chunk(
+    chunk: List[str],
+    plex: PlexAPI,
+    section_id: str,
+    type_id: str,
+    new_unix: int,
+    lock: bool,
+) -> Optional[Exception]:
+    """Bulk-update one chunk; runs on a worker, so report errors by value."""
+    try:
+        plex.update_added_date_bulk(section_id, chunk, type_id, new_unix, lock=lock)
+    except Exception as e:  # noqa: BLE001
+        return e
+    return None
+
+
+def _update_one(
+    rating_key: str,
+    plex: PlexAPI,
+    section_id: str,
+    type_id: str,
+    new_unix: int,
+    lock: bool,
+    gate: Optional[RateGate] = None,
+) -> Optional[Exception]:
+    """Update one item with backoff; thread-safe, returns the last error.
+
+    With a ``gate``, every attempt (retries included) waits for its slot.
+    """
+    last_err: Optional[Exception] = None
+    for attempt in range(4):
+        if gate is not None:
+            gate.wait()
+        try:
+            plex.update_added_date(section_id, rating_key, type_id, new_unix, lock=lock)
+            return None
+        except Exception as e:  # noqa: BLE001
+            last_err = e
+            time.sleep(min(8, 0.5 * (2**attempt)))
+    return last_err
+
+
+def _update_each(
+    keys: List[str],
+    plex: PlexAPI,
+    section_id: str,
+    type_id: str,
+    new_unix: int,
+    lock: bool,
+    pool: Optional[ThreadPoolExecutor] = None,
+    gate: Optional[RateGate] = None,
+) -> int:
+    """Update items one at a time (fanned out over `pool` if given).
+
+    Returns how many succeeded; failures are reported from the script thread.
+    """
+    args = (plex, section_id, type_id, new_unix, lock, gate)
+    if pool is not None:
+        errors = list(pool.map(lambda rk: _update_one(rk, *args), keys))
+    else:
+        errors = [_update_one(rk, *args) for rk in keys]
+    for rating_key, err in zip(keys, errors):
+        if err is not None:
+            st.error(f"Failed updating id={rating_key}: {err}")
+    return sum(err is None for err in errors)
+
+
+def _row_html(item: dict) -> str:
+    """Title heading plus release/ID chips for one legacy-view row."""
+    return _row_html_cached(
+        str(item.get("title", "Unknown")),
+        item.get("year"),
+        str(item.get("originallyAvailableAt") or "-"),
+        str(item.get("ratingKey")),
+    )
+
+
+@functools.lru_cache(maxsize=8192)
+def _row_html_cached(title: str, year: Any, rel: str, rating_key: str) -> str:
+    # Re-rendering the same page (every checkbox click) reuses these strings
+    title = html.escape(title)
+    display = f"{title} ({year})" if year else title
+    rel = html.escape(rel)
+    rk = html.escape(rating_key)
+    return (
+        f"<div class='title-row'><h3>{display}</h3></div>"
+        f"<span class='chip'>Release {rel}</span> <span class='chip'>ID {rk}</span>"
+    )
+
+
+def _editor_date(value: Any) -> Optional[datetime.date]:
+    """Coerce a data_editor date cell (date, datetime or ISO string)."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(str(value)[:10])
+
+
+def _apply_editor_edits(
+    prefix: str,
+    plex: PlexAPI,
+    row_keys: Sequence[str],
+    *,
+    section_id: str,
+    type_id: str,
+    lock_added: bool,
+) -> None:
+    """on_change for the items table: fold edits into selection and Plex."""
+    editor_key = f"{prefix}_editor_{st.session_state.get(f'{prefix}_editor_rev', 0)}"
+    edited = (st.session_state.get(editor_key) or {}).get("edited_rows", {})
+    selected: Set[str] = st.session_state.setdefault(f"{prefix}_selected", set())
+    by_date: Dict[int, List[str]] = {}
+    for idx, changes in edited.items():
+        rk = row_keys[int(idx)]
+        if "select" in changes:
+            if changes["select"]:
+                selected.add(rk)
+            else:
+                selected.discard(rk)
+        new_date = _editor_date(changes.get("added"))
+        if new_date is not None:
+            new_unix = _date_to_unix(new_date)
+            by_date.setdefault(new_unix, []).append(rk)
+    saved = 0
+    for new_unix, keys in by_date.items():
+        try:
+            plex.update_added_date_bulk(
+                section_id, keys, type_id, new_unix, lock=lock_added
             )
+            saved += len(keys)
+        except Exception as e:  # noqa: BLE001
+            _notify(prefix, "error", f"Failed to save {len(keys)} items: {e}")
+    if saved:
+        _invalidate_section(plex.base_url, section_id)
+        _notify(prefix, "toast", f"Saved {saved} items")
+    # The table is rebuilt from selection and Plex next run; a fresh key drops
+    # the edits it has already applied
+    st.session_state[f"{prefix}_editor_rev"] = (
+        st.session_state.get(f"{prefix}_editor_rev", 0) + 1
+    )
+
+
+def _render_table(
+    plex: PlexAPI,
+    items: Sequence[dict],
+    selected: Set[str],
+    *,
+    key_prefix: str,
+    type_id: str,
+    section_id: str,
+    lock_added: bool,
+    show_images: bool,
+) -> None:
+    """Render the page as one data_editor instead of widgets per item."""
+    row_keys = [str(it.get("ratingKey")) for it in items]
+    df = pd.DataFrame(
+        {
+            "select": [rk in selected for rk in row_keys],
+            "thumb": [
+                plex.thumb_url(it.get("thumb"), width=_TABLE_THUMB_W)
+                if show_images
+                else None
+                for it in items
+            ],
+            "title": [
+                f"{it.get('title', 'Unknown')} ({it['year']})"
+                if it.get("year")
+                else it.get("title", "Unknown")
+                for it in items
+            ],
+            "added": [
+                _unix_to_date(int(it["addedAt"])) if it.get("addedAt") else None
+                for it in items
+            ],
+            "release": [it.get("originallyAvailableAt") or "-" for it in items],
+            "ratingKey": row_keys,
+        }
+    )
+    rev = st.session_state.get(f"{key_prefix}_editor_rev", 0)
+    st.data_editor(
+        df,
+        column_config={
+            "select": st.column_config.CheckboxColumn("Select", width="small"),
+            "thumb": (
+                st.column_config.ImageColumn("", width="small") if show_images else None
+            ),
+            "title": st.column_config.TextColumn("Title", width="large"),
+            "added": st.column_config.DateColumn("Added", format="YYYY-MM-DD"),
+            "release": st.column_config.TextColumn("Release"),
+            "ratingKey": st.column_config.TextColumn("ID"),
+        },
+        disabled=["thumb", "title", "release", "ratingKey"],
+        hide_index=True,
+        row_height=60 if show_images else None,
+        key=f"{key_prefix}_editor_{rev}",
+        on_change=_apply_editor_edits,
+        args=(key_prefix, plex, row_keys),
+        kwargs={
+            "section_id": section_id,
+            "type_id": type_id,
+            "lock_added": lock_added,
+        },
+    )
 
 
 def main() -> None:
+    # Fresh query-param snapshot for this run. When the URL is unchanged since
+    # the last run (the usual widget-driven rerun), skip the param handlers.
+    ss = st.session_state
+    ss.pop("_qp_cache", None)
+    sig = _qp_signature(_qp_get())
+    ss["_qp_unchanged"] = sig == ss.get("_qp_sig")
+    ss["_qp_sig"] = sig
     # Density persistence (localStorage → query) and initial hydrate
     _maybe_apply_density_from_query()
     _inject_density_bootstrap()
@@ -824,35 +1842,17 @@ def main() -> None:
     with hdr_c:
         st.selectbox(
             "Density",
-            ["Comfortable", "Compact", "Ultra Compact", "Spacious"],
+            list(_DENSITIES),
             key="ui_density",
         )
     with hdr_r:
-        if st.button("Reset All"):
-            # Reset common keys
-            for k in list(st.session_state.keys()):
-                if (
-                    k.startswith("movie_")
-                    or k.startswith("show_")
-                    or k in {"ui_density"}
-                ):
-                    st.session_state.pop(k, None)
-            st.session_state["ui_density"] = "Comfortable"
-            # Clear nav query params
-            try:
-                st.query_params.clear()
-            except Exception:
-                try:
-                    st.experimental_set_query_params()  # type: ignore[attr-defined]
-                except Exception:
-                    pass
-            st.rerun()
+        st.button("Reset All", on_click=_reset_all)
     with hdr_s:
-        if st.button("Settings", help="Open preferences (density defaults)"):
-            st.session_state["ui_show_settings"] = not st.session_state.get(
-                "ui_show_settings", False
-            )
-            _safe_rerun()
+        st.button(
+            "Settings",
+            help="Open preferences (density defaults)",
+            on_click=_toggle_settings,
+        )
     # Settings expander
     with st.expander(
         "Settings", expanded=bool(st.session_state.get("ui_show_settings", False))
@@ -862,8 +1862,8 @@ def main() -> None:
             key="ui_ptr_default",
             help="When enabled (default), new sessions on touch devices start in Spacious if no saved density exists.",
         )
-        if st.button("Reset density only"):
-            st.session_state["ui_density"] = "Comfortable"
+        st.caption(_page_store_summary())
+        if st.button("Reset density only", on_click=_reset_density):
             try:
                 components.v1.html(
                     """
@@ -873,149 +1873,150 @@ def main() -> None:
                 )  # type: ignore[attr-defined]
             except Exception:
                 pass
-            _safe_rerun()
     _apply_density()
     _init_state()
 
-    plex = PlexAPI()
+    # Normalize like PlexAPI does, so helpers that re-key on plex.base_url
+    # (page store, sections, prefetch) resolve to this same cached client
+    plex = _plex(
+        os.environ.get("PLEX_BASE_URL", "").rstrip("/"),
+        os.environ.get("PLEX_TOKEN", ""),
+    )
     if not plex.base_url or not plex.token:
         st.error("Missing PLEX_BASE_URL or PLEX_TOKEN in environment (.env).")
         st.stop()
 
     try:
-        sections = plex.get_sections()
+        sections = _cached_sections(plex.base_url, plex.token)
     except Exception as e:
         sections = []
         st.warning(f"Could not list library sections: {e}")
 
-    tab1, tab2 = st.tabs(["Movies", "TV Series"])  # TV Series == shows (type=2)
-
-    # Movies
-    with tab1:
-        cfg = _controls("movie", sections=sections, required_type="1")
-        _inject_sticky_filters(
-            "Movies",
-            top_offset_px=56
-            if st.session_state.get("ui_density") == "Spacious"
-            else (44 if st.session_state.get("ui_density") == "Compact" else 48),
-        )
-        section_id = cfg["section_id"] or "1"
-        type_id = "1"
-
-        start = (int(cfg["page"]) - 1) * int(cfg["page_size"])
-        try:
-            items, total = _cached_fetch(
-                plex.base_url,
-                plex.token,
-                section_id,
-                type_id,
-                start,
-                int(cfg["page_size"]),
-                cfg["sort"],
-                cfg["year"] or "",
-            )
-        except Exception as e:
-            st.error(f"Failed to fetch items for section {section_id}: {e}")
-            items, total = [], 0
-
-        # Filter title (current page)
-        title_filter = (cfg["title"] or "").strip().lower()
-        if title_filter:
-            items = [i for i in items if title_filter in (i.get("title", "").lower())]
+    try:
+        # Track the active tab so only its body runs
+        tabs = st.tabs([t[1] for t in _TAB_SPECS], key="ui_tab", on_change="rerun")
+    except TypeError:
+        tabs = st.tabs([t[1] for t in _TAB_SPECS])
+
+    for tab, (prefix, label, type_id, default_section, noun) in zip(tabs, _TAB_SPECS):
+        if getattr(tab, "open", None) is False:
+            _keep_tab_state(prefix)
+            continue
+        with tab:
+            _render_tab(plex, sections, prefix, label, type_id, default_section, noun)
+
+
+def _keep_tab_state(prefix: str) -> None:
+    # Widgets of a skipped tab are not rendered; re-assign their values so
+    # Streamlit does not drop them as orphaned widget state.
+    ss = st.session_state
+    for suffix in _TAB_WIDGET_SUFFIXES:
+        key = prefix + suffix
+        if key in ss:
+            ss[key] = ss[key]
+
+
+@_fragment
+def _render_tab(
+    plex: PlexAPI,
+    sections: List[dict],
+    prefix: str,
+    tab_label: str,
+    required_type: str,
+    default_section: str,
+    noun: str,
+) -> None:
+    page_key = f"{prefix}_page"
+    _handle_query_nav(
+        prefix, page_key, st.session_state.get(f"{prefix}_total_pages", 0)
+    )
+    cfg = _controls(prefix, sections=sections, required_type=required_type)
+    _inject_sticky_filters(
+        tab_label,
+        top_offset_px=_STICKY_TOP.get(st.session_state.get("ui_density"), 48),
+    )
+    section_id = cfg.section_id or default_section
+    type_id = required_type
+    page, page_size, sort, year = cfg.page, cfg.page_size, cfg.sort, cfg.year
 
-        total_pages = max(
-            1, (total + int(cfg["page_size"]) - 1) // int(cfg["page_size"])
-        )
-        _inject_fixed_pager("movie", "Movies", int(cfg["page"]), int(total_pages))
-        _handle_query_nav("movie", "movie_page", int(total_pages))
-        _nav("movie", "top", cfg, total_pages, total, "movie_page")
-
-        if items:
-            _render_items(
-                plex,
-                items,
-                type_id=type_id,
-                select_key="movie_selected",
-                key_prefix="movie",
-                show_images=cfg["show_images"],
-                lock_added=cfg["lock"],
-                section_id=section_id,
-                sort=cfg["sort"],
-                year=cfg["year"] or "",
-                title_filter=title_filter,
-                page_size=int(cfg["page_size"]),
-            )
-        else:
-            st.info("No movies found for current filters.")
-
-        _nav("movie", "bottom", cfg, total_pages, total, "movie_page")
-
-    # Shows
-    with tab2:
-        cfg = _controls("show", sections=sections, required_type="2")
-        _inject_sticky_filters(
-            "TV Series",
-            top_offset_px=56
-            if st.session_state.get("ui_density") == "Spacious"
-            else (44 if st.session_state.get("ui_density") == "Compact" else 48),
+    fetch = functools.partial(
+        _cached_fetch, plex.base_url, plex.token, section_id, type_id
+    )
+    start = (page - 1) * page_size
+    try:
+        items, total = fetch(start, page_size, sort, year, cfg.title)
+        last_page = _total_pages(total, page_size)
+        if page > last_page:
+            # The result set shrank under the current page; show its last one
+            page = last_page
+            st.session_state[page_key] = page
+            start = (page - 1) * page_size
+            items, total = fetch(start, page_size, sort, year, cfg.title)
+    except Exception as e:
+        st.error(f"Failed to fetch items for section {section_id}: {e}")
+        items, total = (), 0
+    else:
+        _prefetch_adjacent(
+            prefix,
+            plex.base_url,
+            plex.token,
+            section_id,
+            type_id,
+            start,
+            page_size,
+            sort,
+            year,
+            cfg.title,
+            total,
         )
-        section_id = cfg["section_id"] or "2"
-        type_id = "2"
-
-        start = (int(cfg["page"]) - 1) * int(cfg["page_size"])
-        try:
-            items, total = _cached_fetch(
-                plex.base_url,
-                plex.token,
-                section_id,
-                type_id,
-                start,
-                int(cfg["page_size"]),
-                cfg["sort"],
-                cfg["year"] or "",
-            )
-        except Exception as e:
-            st.error(f"Failed to fetch items for section {section_id}: {e}")
-            items, total = [], 0
-
-        title_filter = (cfg["title"] or "").strip().lower()
-        if title_filter:
-            items = [i for i in items if title_filter in (i.get("title", "").lower())]
 
-        total_pages = max(
-            1, (total + int(cfg["page_size"]) - 1) // int(cfg["page_size"])
+    total_pages = _total_pages(total, page_size)
+    # Also read by the pager callback and URL nav on the next run
+    st.session_state[f"{prefix}_total_pages"] = total_pages
+    _inject_fixed_pager(prefix, tab_label, page, total_pages)
+    _nav(prefix, "top", page, total_pages, total, page_key)
+
+    if items:
+        _render_items(
+            plex,
+            items,
+            type_id=type_id,
+            select_key=f"{prefix}_selected",
+            key_prefix=prefix,
+            show_images=cfg.show_images,
+            lock_added=cfg.lock,
+            section_id=section_id,
+            year=year,
+            title_filter=cfg.title,
         )
-        _inject_fixed_pager("show", "TV Series", int(cfg["page"]), int(total_pages))
-        _handle_query_nav("show", "show_page", int(total_pages))
-        _nav("show", "top", cfg, total_pages, total, "show_page")
-
-        if items:
-            _render_items(
-                plex,
-                items,
-                type_id=type_id,
-                select_key="show_selected",
-                key_prefix="show",
-                show_images=cfg["show_images"],
-                lock_added=cfg["lock"],
-                section_id=section_id,
-                sort=cfg["sort"],
-                year=cfg["year"] or "",
-                title_filter=title_filter,
-                page_size=int(cfg["page_size"]),
-            )
-        else:
-            st.info("No shows found for current filters.")
+    else:
+        st.info(f"No {noun} found for current filters.")
 
-        _nav("show", "bottom", cfg, total_pages, total, "show_page")
+    _nav(prefix, "bottom", page, total_pages, total, page_key)
 
 
-def _inject_sticky_filters(tab_label: str, top_offset_px: int = 48) -> None:
-    tpl = Template(
+_STICKY_TPL = Template(
+    _minify(
         """
         <script>
           (function(){
             const tabLabel = "$tab";
+            let stuck = null;
+            // One stylesheet per tab in the parent document, updated only
+            // when the offset changes (density switch)
+            const doc = parent.document;
+            const sheetId = 'sticky-filters-' + tabLabel.replace(/[^A-Za-z0-9]+/g, '-');
+            let sheet = doc.getElementById(sheetId);
+            if(!sheet){
+              sheet = doc.createElement('style');
+              sheet.id = sheetId;
+              doc.head.appendChild(sheet);
+            }
+            const rule = '[data-sticky-filters="' + tabLabel + '"] {'
+              + ' position: sticky; top: $toppx; z-index: 900;'
+              + ' background: rgba(255,255,255,0.96); backdrop-filter: blur(2px);'
+              + ' border-bottom: 1px solid #e5e7eb; padding-top: 6px; padding-bottom: 6px; }';
+            if(sheet.textContent!==rule) sheet.textContent = rule;
             function activeTab(){
               const t = parent.document.querySelector('button[role="tab"][aria-selected="true"]');
               return t ? t.innerText.trim() : '';
@@ -1028,6 +2029,8 @@ def _inject_sticky_filters(tab_label: str, top_offset_px: int = 48) -> None:
               return (idx>=0 && panels[idx])? panels[idx] : null;
             }
             function makeSticky(){
+              // Still mounted: nothing to redo until Streamlit rebuilds the row
+              if(stuck && stuck.isConnected) return;
               if(activeTab()!==tabLabel) return;
               const panel = getActivePanel();
               if(!panel) return;
@@ -1041,24 +2044,39 @@ def _inject_sticky_filters(tab_label: str, top_offset_px: int = 48) -> None:
                 node = node.parentElement;
               }
               if(!node) return;
-              node.style.position = 'sticky';
-              node.style.top = '$toppx';
-              node.style.zIndex = '900';
-              node.style.background = 'rgba(255,255,255,0.96)';
-              node.style.backdropFilter = 'blur(2px)';
-              node.style.borderBottom = '1px solid #e5e7eb';
-              node.style.paddingTop = '6px';
-              node.style.paddingBottom = '6px';
+              // One attribute write; the look comes from the shared sheet
+              if(node.getAttribute('data-sticky-filters')!==tabLabel){
+                node.setAttribute('data-sticky-filters', tabLabel);
+              }
+              stuck = node;
+            }
+            // React to DOM changes (coalesced per frame) instead of polling
+            let pending = false;
+            function schedule(){
+              if (pending) return;
+              pending = true;
+              requestAnimationFrame(()=>{ pending = false; makeSticky(); });
             }
-            setTimeout(makeSticky, 50);
-            setInterval(makeSticky, 500);
+            new MutationObserver(schedule).observe(parent.document.body, {
+              childList: true, subtree: true, attributes: true, attributeFilter: ['aria-selected'],
+            });
+            makeSticky();
           })();
         </script>
         """
     )
-    html = tpl.safe_substitute(tab=str(tab_label), toppx=f"{int(top_offset_px)}px")
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _sticky_script(tab_label: str, top_offset_px: int) -> str:
+    return _STICKY_TPL.safe_substitute(tab=tab_label, toppx=f"{top_offset_px}px")
+
+
+def _inject_sticky_filters(tab_label: str, top_offset_px: int = 48) -> None:
+    script = _sticky_script(str(tab_label), int(top_offset_px))
     try:
-        components.v1.html(html, height=0)  # type: ignore[attr-defined]
+        components.v1.html(script, height=0)  # type: ignore[attr-defined]
     except Exception:
         pass
 
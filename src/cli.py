@@ -2,8 +2,10 @@ import argparse
 import datetime
 import os
 import sys
+import threading
 import time
-from typing import Dict, Iterable, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from dotenv import load_dotenv
 
@@ -40,21 +42,21 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     )
     p.add_argument("--date", help="New date in YYYY-MM-DD format")
     p.add_argument("--year", help="Filter by year (server-side)")
-    p.add_argument(
-        "--title-contains", help="Filter current page by title substring (client-side)"
-    )
+    p.add_argument("--title-contains", help="Filter by title substring (server-side)")
     p.add_argument(
         "--ids", nargs="*", help="Explicit ratingKey ids to update (skip fetching)"
     )
     p.add_argument(
         "--page-size", type=int, default=200, help="Fetch page size (default 200)"
     )
-    p.add_argument("--max-items", type=int, help="Stop after updating N matched items")
+    p.add_argument(
+        "--max-items", type=int, help="Update at most the first N matched items"
+    )
     p.add_argument(
         "--sleep",
         type=float,
         default=0.0,
-        help="Sleep seconds between updates (throttle)",
+        help="Minimum seconds between update requests (throttle)",
     )
     p.add_argument(
         "--max-per-minute", type=float, help="Max updates per minute (rate limit)"
@@ -88,34 +90,152 @@ def iter_ids_from_fetch(
     page_size: int,
     year: Optional[str],
     title_contains: Optional[str],
+    max_items: Optional[int] = None,
 ) -> Iterable[str]:
+    """Yield ratingKeys of every matching item (the first ``max_items``).
+
+    Delegates to PlexAPI.fetch_rating_keys, which requests only the fields
+    it needs and fetches the pages after the first concurrently.
+    """
     filters: Dict[str, str] = {}
     if year:
         filters["year"] = str(year)
 
-    page = 0
-    while True:
-        start = page * page_size
-        items, total = plex.fetch_items(
-            section_id,
-            type_id,
-            start=start,
-            size=page_size,
-            sort="addedAt:desc",
-            filters=filters,
+    yield from plex.fetch_rating_keys(
+        section_id,
+        type_id,
+        filters=filters,
+        title_contains=title_contains or "",
+        batch_size=page_size,
+        limit=max_items,
+    )
+
+
+class RateGate:
+    """Hands out request start times at most one item per ``min_interval``.
+
+    Shared by the worker threads: the next slot advances from the previous
+    one rather than from when a request finished, so request latency
+    overlaps the interval instead of adding to it.
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next = time.monotonic()
+
+    def wait(self, items: int = 1) -> None:
+        """Block until a request covering ``items`` ids may start."""
+        if self.min_interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next, now)
+            self._next = slot + self.min_interval * items
+        time.sleep(max(0.0, slot - now))
+
+
+def update_with_retry(
+    plex: PlexAPI,
+    section_id: str,
+    rk: str,
+    type_id: str,
+    new_unix: int,
+    *,
+    lock: bool,
+    gate: RateGate,
+) -> Optional[Exception]:
+    """Update one id, retrying with backoff on top of HTTPAdapter retries."""
+    last_err: Optional[Exception] = None
+    for attempt in range(1, 5):
+        gate.wait()
+        try:
+            plex.update_added_date(section_id, rk, type_id, new_unix, lock=lock)
+            return None
+        except Exception as e:  # noqa: BLE001
+            last_err = e
+            if attempt < 4:
+                print(f"id={rk}: retry {attempt}/3 after error: {e}")
+                time.sleep(min(8, 0.5 * (2 ** (attempt - 1))))
+    return last_err
+
+
+def update_chunk(
+    plex: PlexAPI,
+    section_id: str,
+    chunk: List[str],
+    type_id: str,
+    new_unix: int,
+    *,
+    lock: bool,
+    gate: RateGate,
+) -> List[Tuple[str, Optional[Exception]]]:
+    """Update ``chunk`` with one bulk PUT, falling back to one id at a time."""
+    gate.wait(len(chunk))
+    try:
+        plex.update_added_date_bulk(section_id, chunk, type_id, new_unix, lock=lock)
+        return [(rk, None) for rk in chunk]
+    except Exception as e:  # noqa: BLE001
+        print(f"Bulk update of {len(chunk)} ids failed ({e}); retrying one by one")
+    return [
+        (
+            rk,
+            update_with_retry(
+                plex, section_id, rk, type_id, new_unix, lock=lock, gate=gate
+            ),
         )
-        if not items:
-            break
-        if title_contains:
-            needle = title_contains.lower()
-            items = [i for i in items if needle in (i.get("title", "").lower())]
-        for it in items:
-            rk = it.get("ratingKey")
-            if rk is not None:
-                yield str(rk)
-        page += 1
-        if start + page_size >= total:
-            break
+        for rk in chunk
+    ]
+
+
+def apply_updates(
+    plex: PlexAPI,
+    section_id: str,
+    type_id: str,
+    ids: List[str],
+    new_unix: int,
+    *,
+    lock: bool,
+    min_interval: float = 0.0,
+    workers: int = 4,
+    chunk_size: int = 50,
+) -> int:
+    """Update ``ids`` in bulk chunks over a small worker pool.
+
+    ``min_interval`` (seconds per item) applies across all workers, so
+    --sleep/--max-per-minute hold regardless of concurrency. Returns how
+    many ids were updated.
+    """
+    gate = RateGate(min_interval)
+    if min_interval > 0:
+        # Keep a throttled chunk within one minute's budget
+        chunk_size = max(1, min(chunk_size, int(60 / min_interval)))
+    chunks = [ids[o : o + chunk_size] for o in range(0, len(ids), chunk_size)]
+    total = len(ids)
+    done = updated = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [
+            pool.submit(
+                update_chunk,
+                plex,
+                section_id,
+                chunk,
+                type_id,
+                new_unix,
+                lock=lock,
+                gate=gate,
+            )
+            for chunk in chunks
+        ]
+        for fut in as_completed(futures):
+            for rk, err in fut.result():
+                done += 1
+                if err is None:
+                    updated += 1
+                    print(f"[{done}/{total}] Updated id={rk}")
+                else:
+                    print(f"[{done}/{total}] Failed id={rk}: {err}", file=sys.stderr)
+    return updated
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -168,6 +288,8 @@ def main(argv: Optional[List[str]] = None) -> int:
                 page_size=args.page_size,
                 year=args.year,
                 title_contains=args.title_contains,
+                # 0 means no cap, as in the truncation below
+                max_items=args.max_items or None,
             )
         )
 
@@ -176,40 +298,28 @@ def main(argv: Optional[List[str]] = None) -> int:
         return 0
 
     print(f"Matched {len(ids)} items. {'DRY RUN' if args.dry_run else ''}")
-    updated = 0
+    if args.max_items:
+        ids = ids[: args.max_items]
+    if args.dry_run:
+        for rk in ids:
+            print(f"Would update id={rk} to {args.date} (unix={new_unix})")
+        print("Done. Updated 0 item(s).")
+        return 0
+
     # Derived throttle from max-per-minute
     rate_sleep = 0.0
     if args.max_per_minute and args.max_per_minute > 0:
         rate_sleep = max(0.0, 60.0 / float(args.max_per_minute))
     per_item_sleep = max(float(args.sleep), rate_sleep)
-    for idx, rk in enumerate(ids, start=1):
-        if args.max_items and updated >= args.max_items:
-            break
-        if args.dry_run:
-            print(f"Would update id={rk} to {args.date} (unix={new_unix})")
-        else:
-            # Simple retry with backoff in addition to HTTPAdapter retries
-            attempts = 0
-            last_err = None
-            while attempts < 4:
-                try:
-                    plex.update_added_date(
-                        args.section_id, rk, type_id, new_unix, lock=lock
-                    )
-                    print(f"[{idx}/{len(ids)}] Updated id={rk}")
-                    updated += 1
-                    last_err = None
-                    break
-                except Exception as e:  # noqa: BLE001
-                    attempts += 1
-                    last_err = e
-                    sleep_for = min(8, 0.5 * (2 ** (attempts - 1)))
-                    print(f"[{idx}/{len(ids)}] Retry {attempts}/3 after error: {e}")
-                    time.sleep(sleep_for)
-            if last_err is not None:
-                print(f"[{idx}/{len(ids)}] Failed id={rk}: {last_err}", file=sys.stderr)
-        if per_item_sleep:
-            time.sleep(per_item_sleep)
+    updated = apply_updates(
+        plex,
+        args.section_id,
+        type_id,
+        ids,
+        new_unix,
+        lock=lock,
+        min_interval=per_item_sleep,
+    )
 
     print(f"Done. Updated {updated} item(s).")
     return 0
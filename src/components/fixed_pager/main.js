@@ -0,0 +1,109 @@
+// Fixed pager served as a static Streamlit component: parsed once per
+// session, then updated in place from "streamlit:render" props.
+(function () {
+  "use strict";
+  const root = document.getElementById("fixed-pager");
+  const tabEl = root.querySelector(".tab");
+  const statusEl = root.querySelector(".status");
+  const gotoEl = root.querySelector(".goto");
+  const prevEl = root.querySelector(".prev");
+  const nextEl = root.querySelector(".next");
+  let props = null;
+  let isActive = false;
+  let pending = false;
+  let frameHeight = -1;
+  // Keep in sync with pager.css
+  const NAV_H = {
+    "ultra-compact": 40, compact: 44, comfortable: 48, spacious: 56,
+  };
+
+  function send(type, data) {
+    window.parent.postMessage(
+      Object.assign({ isStreamlitMessage: true, type: type }, data),
+      "*"
+    );
+  }
+
+  // Each action carries a timestamp so repeated clicks are distinct values
+  function act(action, page) {
+    if (!props) return;
+    send("streamlit:setComponentValue", {
+      value: { action: action, page: page || null, seq: Date.now() },
+      dataType: "json",
+    });
+  }
+
+  function activeTab() {
+    const t = parent.document.querySelector('button[role="tab"][aria-selected="true"]');
+    return t ? t.textContent.trim() : "";
+  }
+
+  function showIfActive() {
+    if (!props) return;
+    isActive = activeTab() === props.tab;
+    if (pending) return;
+    pending = true;
+    requestAnimationFrame(function () {
+      pending = false;
+      const desired = isActive ? "flex" : "none";
+      if (root.style.display !== desired) root.style.display = desired;
+    });
+  }
+
+  function render(args) {
+    props = args;
+    const density = args.density || "comfortable";
+    if (document.documentElement.dataset.density !== density) {
+      document.documentElement.dataset.density = density;
+    }
+    tabEl.textContent = args.tab;
+    statusEl.textContent = "Page " + args.page + " / " + args.total;
+    gotoEl.max = String(Math.max(1, args.total));
+    if (document.activeElement !== gotoEl) gotoEl.value = String(args.page);
+    prevEl.disabled = args.page <= 1;
+    nextEl.disabled = args.page >= args.total;
+    const navH = NAV_H[density] || NAV_H.comfortable;
+    if (frameHeight !== navH) {
+      frameHeight = navH;
+      send("streamlit:setFrameHeight", { height: navH });
+    }
+    showIfActive();
+  }
+
+  function gotoPage() {
+    const v = parseInt(gotoEl.value, 10);
+    if (v) act("goto", v);
+  }
+
+  prevEl.addEventListener("click", function () { act("prev"); });
+  nextEl.addEventListener("click", function () { act("next"); });
+  root.querySelector(".go").addEventListener("click", gotoPage);
+  // Held arrow keys fire many repeats per frame; send at most one step each
+  let keyDir = null;
+  function queueKeyNav(dir) {
+    if (keyDir === null) {
+      requestAnimationFrame(function () {
+        const d = keyDir;
+        keyDir = null;
+        act(d);
+      });
+    }
+    keyDir = dir;
+  }
+  window.addEventListener("keydown", function (e) {
+    if (!isActive) return;
+    if (e.key === "ArrowLeft") queueKeyNav("prev");
+    if (e.key === "ArrowRight") queueKeyNav("next");
+    if (e.key === "Enter" && document.activeElement === gotoEl) gotoPage();
+  });
+  // React to tab switches instead of polling
+  new MutationObserver(showIfActive).observe(parent.document.body, {
+    subtree: true, attributes: true, attributeFilter: ["aria-selected"],
+  });
+
+  window.addEventListener("message", function (event) {
+    const data = event.data;
+    if (data && data.type === "streamlit:render") render(data.args);
+  });
+  send("streamlit:componentReady", { apiVersion: 1 });
+})();
@@ -1,5 +1,8 @@
+import functools
 import os
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode
 
 import requests
 from requests import Session
@@ -7,9 +10,48 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+try:  # optional; decodes large MediaContainer payloads several times faster
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 load_dotenv()
 
 
+def _media_container(response: requests.Response) -> dict:
+    """Decode a Plex JSON response and return its MediaContainer."""
+    if orjson is not None:
+        data = orjson.loads(response.content)
+    else:
+        data = response.json()
+    return data.get("MediaContainer", {})
+
+
+@functools.lru_cache(maxsize=4096)
+def _thumb_url(base_url: str, token: str, path: str, width: int = 0) -> str:
+    # Memoized: every rerun rebuilds the same URLs for the visible page
+    # Some thumbs are already absolute; if so, return as-is
+    if path.startswith("http://") or path.startswith("https://"):
+        # Ensure token
+        joiner = "&" if "?" in path else "?"
+        return f"{path}{joiner}X-Plex-Token={token}"
+    if width:
+        # Let Plex's photo transcoder scale the poster to display size (posters
+        # are 2:3) instead of shipping the full-resolution original
+        query = urlencode(
+            {
+                "url": path,
+                "width": width,
+                "height": width * 3 // 2,
+                "minSize": 1,
+                "upscale": 0,
+                "X-Plex-Token": token,
+            }
+        )
+        return f"{base_url}/photo/:/transcode?{query}"
+    return f"{base_url}{path}?X-Plex-Token={token}"
+
+
 class PlexAPI:
     def __init__(self, base_url: Optional[str] = None, token: Optional[str] = None):
         if base_url is None:
@@ -19,6 +61,8 @@ class PlexAPI:
         self.base_url = (base_url or "").rstrip("/")
         self.token = token or ""
         self.session = self._build_session()
+        # Token and Accept never change per client; set them once
+        self.session.headers.update(self._get_headers())
 
     def _build_session(self) -> Session:
         s = requests.Session()
@@ -32,7 +76,9 @@ class PlexAPI:
             allowed_methods={"GET", "PUT"},
             raise_on_status=False,
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        # One client is shared by every session plus the prefetch, refresh
+        # and batch-apply workers; keep enough keep-alive connections for all
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
         s.mount("http://", adapter)
         s.mount("https://", adapter)
         return s
@@ -53,10 +99,12 @@ class PlexAPI:
         size: int = 100,
         sort: str = "addedAt:desc",
         filters: Optional[Dict[str, str]] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> Tuple[List[dict], int]:
         """Fetch items from a library section with pagination.
 
-        Returns (items, total_size).
+        ``fields`` limits each item to the named attributes. Returns
+        (items, total_size).
         """
         url = f"{self.base_url}/library/sections/{section_id}/all"
         params: Dict[str, str] = {
@@ -69,19 +117,135 @@ class PlexAPI:
             params.update(
                 {k: str(v) for k, v in filters.items() if v not in (None, "")}
             )
+        if fields:
+            params["includeFields"] = ",".join(fields)
 
-        response = self.session.get(
-            url, headers=self._get_headers(), params=params, timeout=30
-        )
+        response = self.session.get(url, params=params, timeout=30)
         response.raise_for_status()
-        container = response.json().get("MediaContainer", {})
+        container = _media_container(response)
         items = container.get("Metadata", []) or []
+        if fields:
+            # Servers that ignore includeFields still send full items; keep
+            # only what was asked for so cached pages stay small
+            items = [{f: i[f] for f in fields if f in i} for i in items]
         total = container.get("totalSize")
         if total is None:
             # Fallbacks used by Plex in some builds
             total = container.get("size", len(items))
         return items, int(total)
 
+    def fetch_total(
+        self,
+        section_id: str,
+        type_id: str,
+        *,
+        filters: Optional[Dict[str, str]] = None,
+    ) -> int:
+        """Return the item count for a section/type without fetching items."""
+        _items, total = self.fetch_items(
+            section_id, type_id, start=0, size=0, filters=filters
+        )
+        return total
+
+    def fetch_all_fields(
+        self,
+        section_id: str,
+        type_id: str,
+        fields: Sequence[str],
+        *,
+        filters: Optional[Dict[str, str]] = None,
+        batch_size: int = 5000,
+        workers: int = 4,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        """Return ``fields`` of every matching item in a section.
+
+        The first response gives the total; the remaining batches are
+        fetched ``workers`` at a time and merged in server order. With
+        ``limit``, batches past the first ``limit`` items are not requested.
+        """
+        if limit is not None:
+            batch_size = max(1, min(batch_size, limit))
+
+        def batch(start: int) -> List[dict]:
+            items, _total = self.fetch_items(
+                section_id,
+                type_id,
+                start=start,
+                size=batch_size,
+                filters=filters,
+                fields=fields,
+            )
+            return items
+
+        items, total = self.fetch_items(
+            section_id,
+            type_id,
+            start=0,
+            size=batch_size,
+            filters=filters,
+            fields=fields,
+        )
+        if limit is not None:
+            total = min(total, limit)
+        batches = [items]
+        # Step by what the server actually returned, in case it caps batches
+        starts = range(len(items), total, len(items)) if items else ()
+        if starts:
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+                batches.extend(pool.map(batch, starts))
+        return [i for items in batches for i in items][:total]
+
+    def fetch_rating_keys(
+        self,
+        section_id: str,
+        type_id: str,
+        *,
+        filters: Optional[Dict[str, str]] = None,
+        title_contains: str = "",
+        batch_size: int = 5000,
+        workers: int = 4,
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        """Return the ratingKeys of every matching item in a section.
+
+        Only ``ratingKey`` (and ``title`` when filtering by title) is
+        requested, so large libraries come back in a handful of small
+        responses instead of one full page per screen of results.
+        ``title_contains`` is sent to Plex as a ``title`` filter; titles
+        are re-checked locally in case a server ignores it. ``limit`` caps
+        the number of returned (locally matching) keys.
+        """
+        needle = title_contains.lower()
+        fields = ("ratingKey", "title") if needle else ("ratingKey",)
+        if needle:
+            filters = {**(filters or {}), "title": needle}
+
+        def walk(cap: Optional[int]) -> Tuple[int, List[str]]:
+            items = self.fetch_all_fields(
+                section_id,
+                type_id,
+                fields,
+                filters=filters,
+                batch_size=batch_size,
+                workers=workers,
+                limit=cap,
+            )
+            keys = [
+                str(i["ratingKey"])
+                for i in items
+                if i.get("ratingKey")
+                and (not needle or needle in (i.get("title") or "").lower())
+            ]
+            return len(items), keys
+
+        fetched, keys = walk(limit)
+        if limit is not None and fetched == limit and len(keys) < limit:
+            # Items were dropped locally, so the server ignored ``title`` and
+            # the capped walk counted non-matches; walk the whole section
+            _fetched, keys = walk(None)
+        return keys[:limit]
+
     # Backwards compatibility helpers
     def get_all_movies(self):
         # default first page only to avoid massive payloads
@@ -103,39 +267,50 @@ class PlexAPI:
         *,
         lock: bool = True,
     ) -> bool:
+        return self.update_added_date_bulk(
+            section_id, [item_id], type_id, new_date_unix, lock=lock
+        )
+
+    def update_added_date_bulk(
+        self,
+        section_id: str,
+        item_ids: Sequence[str],
+        type_id: str,
+        new_date_unix: int,
+        *,
+        lock: bool = True,
+    ) -> bool:
+        """Set addedAt on several items with one PUT (ids are comma-joined)."""
         url = f"{self.base_url}/library/sections/{section_id}/all"
         params = {
             "type": str(type_id),
-            "id": str(item_id),
+            "id": ",".join(str(i) for i in item_ids),
             "addedAt.value": str(new_date_unix),
         }
         if lock:
             params["addedAt.locked"] = "1"
-        response = self.session.put(
-            url, params=params, headers=self._get_headers(), timeout=30
-        )
+        response = self.session.put(url, params=params, timeout=30)
         response.raise_for_status()
         return True
 
     # --- Utilities ---
-    def thumb_url(self, path: Optional[str]) -> Optional[str]:
+    def thumb_url(self, path: Optional[str], width: int = 0) -> Optional[str]:
+        """Absolute, tokenized image URL; ``width`` > 0 requests a scaled copy."""
         if not path:
             return None
-        # Some thumbs are already absolute; if so, return as-is
-        if path.startswith("http://") or path.startswith("https://"):
-            # Ensure token
-            joiner = "&" if "?" in path else "?"
-            return f"{path}{joiner}X-Plex-Token={self.token}"
-        return f"{self.base_url}{path}?X-Plex-Token={self.token}"
+        return _thumb_url(self.base_url, self.token, path, width)
 
     # --- Sections ---
-    def get_sections(self) -> List[dict]:
-        """Return available library sections (key, title, type)."""
+    def _section_directories(self) -> List[dict]:
         url = f"{self.base_url}/library/sections"
-        resp = self.session.get(url, headers=self._get_headers(), timeout=30)
+        resp = self.session.get(url, timeout=30)
         resp.raise_for_status()
-        container = resp.json().get("MediaContainer", {})
-        dirs = container.get("Directory", []) or []
+        container = _media_container(resp)
+        return container.get("Directory", []) or []
+
+    def get_sections(self) -> List[dict]:
+        """Return available library sections (key, title, type)."""
+        dirs = self._section_directories()
         # Normalize fields
         out: List[dict] = []
         for d in dirs:
@@ -147,3 +322,18 @@ class PlexAPI:
                 }
             )
         return out
+
+    def section_versions(self) -> Dict[str, str]:
+        """Return a change marker per section key.
+
+        Built from the section's contentChangedAt/updatedAt/scannedAt stamps,
+        so an unchanged marker means cached pages of that section are still
+        valid. One request covers every section.
+        """
+        out: Dict[str, str] = {}
+        for d in self._section_directories():
+            out[str(d.get("key"))] = ":".join(
+                str(d.get(f) or "")
+                for f in ("contentChangedAt", "updatedAt", "scannedAt")
+            )
+        return out
@@ -1,6 +1,10 @@
+import functools
+
 import streamlit as st
 from streamlit import components
 
+_VALID_DENSITIES = frozenset({"Ultra Compact", "Compact", "Comfortable", "Spacious"})
+
 
 def maybe_apply_density_from_query() -> None:
     try:
@@ -13,9 +17,8 @@ def maybe_apply_density_from_query() -> None:
     if not qp:
         return
     raw = qp.get("ui_density")
-    valid = {"Ultra Compact", "Compact", "Comfortable", "Spacious"}
     val = raw[0] if isinstance(raw, list) else raw
-    if val and val in valid:
+    if val and val in _VALID_DENSITIES:
         st.session_state["ui_density"] = val
         try:
             st.query_params.clear()
@@ -39,8 +42,10 @@ def inject_density_bootstrap() -> None:
     """Bootstrap density from localStorage once per tab.
 
     If no saved density exists, prefer Spacious on touch devices (pointer: coarse),
-    otherwise Comfortable.
+    otherwise Comfortable. Rendered once per session; later reruns skip it.
     """
+    if st.session_state.get("_density_bootstrapped"):
+        return
     cur = st.session_state.get("ui_density", "Comfortable")
     html = f"""
     <script>
@@ -71,15 +76,22 @@ def inject_density_bootstrap() -> None:
     try:
         components.v1.html(html, height=0)  # type: ignore[attr-defined]
     except Exception:
-        pass
+        return
+    st.session_state["_density_bootstrapped"] = True
 
 
 def apply_density() -> None:
     """Apply global, density-aware CSS tokens for the whole UI."""
     density = st.session_state.get("ui_density", "Comfortable")
-    if density not in {"Ultra Compact", "Compact", "Comfortable", "Spacious"}:
+    if density not in _VALID_DENSITIES:
         density = "Comfortable"
+    ptr_default = "1" if bool(st.session_state.get("ui_ptr_default", True)) else "0"
+    st.markdown(_density_html(density, ptr_default), unsafe_allow_html=True)
+
 
+@functools.lru_cache(maxsize=8)
+def _density_html(density: str, ptr_default: str) -> str:
+    """The style/script block for one density (at most eight ever get built)."""
     tokens = {
         "Ultra Compact": {
             "scale": 0.8,
@@ -125,8 +137,7 @@ def apply_density() -> None:
     t100 = max(12, int(round(12 * scale)))
     t200 = max(13, int(round(14 * scale)))
 
-    ptr_default = "1" if bool(st.session_state.get("ui_ptr_default", True)) else "0"
-    css = f"""
+    return f"""
     <style>
       :root {{
         --density: '{density}';
@@ -161,9 +172,7 @@ def apply_density() -> None:
     </style>
     <script>
       try {{ parent.document.documentElement.dataset.density = '{density}'.toLowerCase().replace(' ', '-'); }} catch(e) {{}}
-      try {{ localStorage.setItem('ui_density', '{density}'); }} catch(e) {{}}
-      try {{ localStorage.setItem('ui_ptr_default', '{ptr_default}'); }} catch(e) {{}}
+      try {{ if (localStorage.getItem('ui_density') !== '{density}') localStorage.setItem('ui_density', '{density}'); }} catch(e) {{}}
+      try {{ if (localStorage.getItem('ui_ptr_default') !== '{ptr_default}') localStorage.setItem('ui_ptr_default', '{ptr_default}'); }} catch(e) {{}}
     </script>
     """
-
-    st.markdown(css, unsafe_allow_html=True)
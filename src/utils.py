@@ -1,6 +1,12 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
 def format_date(date_string):
     from datetime import datetime
 
+    if not date_string:
+        return None
     try:
         return datetime.strptime(date_string, "%Y-%m-%d").date()
     except ValueError:
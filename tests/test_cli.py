@@ -8,7 +8,14 @@ SRC = os.path.abspath(os.path.join(HERE, "..", "src"))
 if SRC not in sys.path:
     sys.path.insert(0, SRC)
 
-from cli import parse_args, to_unix  # noqa: E402
+from cli import (  # noqa: E402
+    apply_updates,
+    iter_ids_from_fetch,
+    main,
+    parse_args,
+    to_unix,
+)
+from plex_api import PlexAPI
 
 
 def test_parse_args_minimal_update():
@@ -39,3 +46,64 @@ def test_to_unix_invalid_raises():
         assert False, "Expected SystemExit for invalid date"
     except SystemExit as e:
         assert "Invalid --date value" in str(e)
+
+
+def test_iter_ids_from_fetch_walks_all_pages():
+    plex = PlexAPI(base_url="http://plex:32400", token="tok")
+    starts = []
+
+    def fetch_items(section_id, type_id, *, start, size, filters, fields):
+        starts.append(start)
+        last = min(start + size, 5)
+        return [{"ratingKey": n + 1} for n in range(start, last)], 5
+
+    plex.fetch_items = fetch_items
+    ids = list(iter_ids_from_fetch(plex, "1", "1", 2, None, None))
+    assert ids == ["1", "2", "3", "4", "5"]
+    assert sorted(starts) == [0, 2, 4]
+
+    # --max-items stops the walk instead of fetching pages it won't use
+    starts.clear()
+    ids = list(iter_ids_from_fetch(plex, "1", "1", 2, None, None, max_items=3))
+    assert ids == ["1", "2", "3"]
+    assert sorted(starts) == [0, 2]
+
+
+def test_main_max_items_zero_means_no_cap(monkeypatch, capsys):
+    def fetch_items(self, section_id, type_id, *, start, size, filters, fields):
+        return [{"ratingKey": n + 1} for n in range(start, min(start + size, 3))], 3
+
+    monkeypatch.setattr(PlexAPI, "fetch_items", fetch_items)
+    argv = ["--base-url", "http://plex:32400", "--token", "tok", "--section-id", "1"]
+    argv += ["--type", "movie", "--date", "2024-01-15", "--max-items", "0"]
+    assert main(argv + ["--dry-run"]) == 0
+    out = capsys.readouterr().out
+    assert "Matched 3 items" in out
+    assert out.count("Would update") == 3
+
+
+def test_apply_updates_bulk_with_per_id_fallback(monkeypatch):
+    monkeypatch.setattr("cli.time.sleep", lambda s: None)
+    plex = PlexAPI(base_url="http://plex:32400", token="tok")
+    bulk, single = [], []
+
+    def update_added_date_bulk(section_id, ids, type_id, new_unix, *, lock):
+        bulk.append(list(ids))
+        if "bad" in ids:
+            raise RuntimeError("boom")
+        return True
+
+    def update_added_date(section_id, rk, type_id, new_unix, *, lock):
+        single.append(rk)
+        if rk == "bad":
+            raise RuntimeError("boom")
+        return True
+
+    plex.update_added_date_bulk = update_added_date_bulk
+    plex.update_added_date = update_added_date
+    ids = ["1", "2", "3", "bad"]
+    updated = apply_updates(plex, "1", "1", ids, 0, lock=True, chunk_size=2)
+    assert updated == 3
+    assert sorted(map(tuple, bulk)) == [("1", "2"), ("3", "bad")]
+    # Only the failed chunk is retried per id; "bad" gets all four attempts
+    assert single.count("3") == 1 and single.count("bad") == 4
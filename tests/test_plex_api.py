@@ -0,0 +1,184 @@
+import json
+import os
+import sys
+
+# Ensure src/ is importable when tests run from project root
+HERE = os.path.dirname(__file__)
+SRC = os.path.abspath(os.path.join(HERE, "..", "src"))
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from plex_api import PlexAPI
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+        self.content = json.dumps(payload).encode()
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    def __init__(self, payload):
+        self.payload = payload
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return FakeResponse(self.payload)
+
+
+SECTIONS = {
+    "MediaContainer": {
+        "Directory": [
+            {
+                "key": 1,
+                "title": "Movies",
+                "type": "movie",
+                "contentChangedAt": 100,
+                "updatedAt": 200,
+                "scannedAt": 300,
+            },
+            {"key": "2", "title": "TV", "type": "show", "updatedAt": 5},
+        ]
+    }
+}
+
+
+def make_plex(payload):
+    plex = PlexAPI(base_url="http://plex:32400/", token="tok")
+    plex.session = FakeSession(payload)
+    return plex
+
+
+def test_session_carries_auth_headers():
+    plex = PlexAPI(base_url="http://plex:32400", token="tok")
+    assert plex.session.headers["X-Plex-Token"] == "tok"
+    assert plex.session.headers["Accept"] == "application/json"
+
+
+def test_get_sections_normalizes_fields():
+    plex = make_plex(SECTIONS)
+    sections = plex.get_sections()
+    assert sections[0] == {"key": "1", "title": "Movies", "type": "movie"}
+    assert plex.session.calls[0][0] == "http://plex:32400/library/sections"
+
+
+def test_section_versions_one_request_for_all_sections():
+    plex = make_plex(SECTIONS)
+    versions = plex.section_versions()
+    assert versions == {"1": "100:200:300", "2": ":5:"}
+    assert len(plex.session.calls) == 1
+
+
+def test_fetch_total_requests_no_items():
+    plex = make_plex({"MediaContainer": {"size": 0, "totalSize": 1234}})
+    assert plex.fetch_total("1", "1") == 1234
+    params = plex.session.calls[0][1]["params"]
+    assert params["X-Plex-Container-Size"] == "0"
+
+
+def test_fetch_rating_keys_requests_only_keys():
+    payload = {
+        "MediaContainer": {
+            "totalSize": 2,
+            "Metadata": [{"ratingKey": 7, "title": "Alpha"}, {"ratingKey": "8"}],
+        }
+    }
+    plex = make_plex(payload)
+    assert plex.fetch_rating_keys("1", "1") == ["7", "8"]
+    assert plex.session.calls[0][1]["params"]["includeFields"] == "ratingKey"
+    assert len(plex.session.calls) == 1
+
+
+def test_fetch_rating_keys_title_filter():
+    payload = {
+        "MediaContainer": {
+            "totalSize": 2,
+            "Metadata": [
+                {"ratingKey": "7", "title": "Alpha"},
+                {"ratingKey": "8", "title": "Beta"},
+            ],
+        }
+    }
+    plex = make_plex(payload)
+    # The fake server ignores the filter, so the local re-check still applies
+    assert plex.fetch_rating_keys("1", "1", title_contains="ALP") == ["7"]
+    assert plex.session.calls[0][1]["params"]["title"] == "alp"
+
+
+def test_fetch_rating_keys_fetches_remaining_batches():
+    plex = make_plex({})
+
+    def get(url, **kwargs):
+        start = int(kwargs["params"]["X-Plex-Container-Start"])
+        plex.session.calls.append((url, kwargs))
+        batch = [{"ratingKey": n + 1} for n in range(start, min(start + 2, 5))]
+        return FakeResponse({"MediaContainer": {"totalSize": 5, "Metadata": batch}})
+
+    plex.session.get = get
+    assert plex.fetch_rating_keys("1", "1", batch_size=2) == ["1", "2", "3", "4", "5"]
+    assert len(plex.session.calls) == 3
+
+
+def test_fetch_rating_keys_limit_counts_local_title_matches():
+    plex = make_plex({})
+
+    def get(url, **kwargs):
+        # Ignores the title filter: every other item is an "alpha"
+        params = kwargs["params"]
+        start = int(params["X-Plex-Container-Start"])
+        stop = min(start + int(params["X-Plex-Container-Size"]), 10)
+        batch = [
+            {"ratingKey": n + 1, "title": "Alpha" if n % 2 else "Beta"}
+            for n in range(start, stop)
+        ]
+        return FakeResponse({"MediaContainer": {"totalSize": 10, "Metadata": batch}})
+
+    plex.session.get = get
+    keys = plex.fetch_rating_keys("1", "1", title_contains="alp", limit=3)
+    assert keys == ["2", "4", "6"]
+
+
+def test_update_added_date_bulk_joins_ids():
+    plex = make_plex({})
+    puts = []
+    plex.session.put = lambda url, **kw: puts.append((url, kw)) or FakeResponse({})
+    assert plex.update_added_date_bulk("1", ["7", "8", "9"], "1", 1700000000)
+    params = puts[0][1]["params"]
+    assert params["id"] == "7,8,9"
+    assert params["addedAt.locked"] == "1"
+    assert len(puts) == 1
+
+
+def test_fetch_items_fields_trims_items():
+    payload = {
+        "MediaContainer": {
+            "totalSize": 1,
+            "Metadata": [{"ratingKey": "7", "title": "Alpha", "Media": [{}]}],
+        }
+    }
+    plex = make_plex(payload)
+    items, _total = plex.fetch_items("1", "1", fields=("ratingKey", "title"))
+    assert items == [{"ratingKey": "7", "title": "Alpha"}]
+    assert plex.session.calls[0][1]["params"]["includeFields"] == "ratingKey,title"
+
+
+def test_thumb_url_relative_and_absolute():
+    plex = make_plex({})
+    assert plex.thumb_url("/t/1") == "http://plex:32400/t/1?X-Plex-Token=tok"
+    assert plex.thumb_url("https://cdn/x?a=1") == "https://cdn/x?a=1&X-Plex-Token=tok"
+    assert plex.thumb_url(None) is None
+
+
+def test_thumb_url_scaled_uses_transcoder():
+    plex = make_plex({})
+    url = plex.thumb_url("/library/metadata/7/thumb/1", width=220)
+    assert url.startswith("http://plex:32400/photo/:/transcode?")
+    assert "url=%2Flibrary%2Fmetadata%2F7%2Fthumb%2F1" in url
+    assert "width=220&height=330" in url and url.endswith("X-Plex-Token=tok")